@@ -46,6 +46,22 @@ Version:         3
             self.version_header.raise_if_version_is_less_than, 4
         )
 
+    def test_exception_messages(self):
+        """Exceptions should report the expected and the actual values."""
+        with self.assertRaises(vh.WrongYamlFileType) as type_ctx:
+            self.version_header.raise_if_not_type("FooReport")
+        self.assertEqual(
+            str(type_ctx.exception),
+            "Expected FileType: 'FooReport' but got 'CommitReport'"
+        )
+
+        with self.assertRaises(vh.WrongYamlFileVersion) as version_ctx:
+            self.version_header.raise_if_version_is_less_than(4)
+        self.assertEqual(
+            str(version_ctx.exception),
+            "Expected minimal version: '4' but got version '3'"
+        )
+
     @unittest.mock.patch("builtins.open", create=True)
     def test_loading_of_wrong_yaml_doc(self, mock_open):
         """If we pass a wrong yaml document into VersionHeader we expect and
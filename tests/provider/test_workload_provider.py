@@ -0,0 +1,32 @@
+"""Test workload provider."""
+import unittest
+from pathlib import Path
+
+from tests.test_utils import run_in_test_environment
+from varats.projects.c_projects.xz import Xz
+from varats.provider.workload.workload_provider import WorkloadProvider
+from varats.utils.settings import vara_cfg
+
+
+class TestWorkloadProvider(unittest.TestCase):
+    """Test workload lookup for project binaries."""
+
+    @run_in_test_environment()
+    def test_workload_is_resolved_against_base_location(self) -> None:
+        """Test that workload files are resolved against the currently
+        configured workloads base location."""
+        vara_cfg()["experiment"]["workloads_base_location"] = "/workloads"
+        provider = WorkloadProvider.create_provider_for_project(Xz)
+
+        workload = provider.get_workload_for_binary("xz")
+        self.assertIsInstance(workload, tuple)
+        self.assertEqual(
+            str(Path("/workloads/compression/countries-land-1km.geo.json")),
+            workload[-1]
+        )
+
+    def test_unknown_binary(self) -> None:
+        """Test that binaries without a workload get no arguments."""
+        provider = WorkloadProvider.create_provider_for_project(Xz)
+
+        self.assertIsNone(provider.get_workload_for_binary("unxz"))
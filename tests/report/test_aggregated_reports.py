@@ -8,6 +8,7 @@ import numpy as np
 
 from varats.experiment.experiment_util import ZippedReportFolder
 from varats.report.gnu_time_report import TimeReportAggregate
+from varats.report.report import BaseReport, ReportAggregate
 
 GNU_TIME_OUTPUT1 = """	Command being timed: "sleep 2"
 	User time (seconds): 0.00
@@ -90,3 +91,35 @@ class TestTimeReportAggregate(unittest.TestCase):
                 np.std(time_aggregate.measurements_wall_clock_time)
             )
             self.assertEqual(mean_std, (3.0, 1.0))
+            self.assertIn(
+                "mean (std) of wall clock time = 3.00 (1.00)\n",
+                time_aggregate.summary
+            )
+
+
+class TestReportAggregate(unittest.TestCase):
+    """Test which entries of an aggregate archive are passed on as reports."""
+
+    def test_folder_reports(self) -> None:
+        """Test if top-level folders of the archive are reports, too."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir) / "FolderAggregateTest.zip"
+            with ZippedReportFolder(tmp_file) as reports_dir:
+                (Path(reports_dir) / "file_report.txt").write_text("report")
+                folder_report = Path(reports_dir) / "folder_report"
+                (folder_report / "nested").mkdir(parents=True)
+                (folder_report / "nested" / "part.txt").write_text("part")
+
+            aggregate = ReportAggregate(tmp_file, BaseReport)
+            report_paths = [report.path for report in aggregate.reports()]
+
+            self.assertEqual(
+                sorted(path.name for path in report_paths),
+                ["file_report.txt", "folder_report"]
+            )
+            folder_report_path = next(
+                path for path in report_paths if path.name == "folder_report"
+            )
+            self.assertTrue(
+                (folder_report_path / "nested" / "part.txt").exists()
+            )
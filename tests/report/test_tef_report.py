@@ -1,11 +1,22 @@
 """Test TEFReport."""
 
+import gc
 import json
+import typing as tp
 import unittest
+import unittest.mock as mock
 from pathlib import Path
-from unittest import mock
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
-from varats.report.tef_report import TEFReport, TraceEvent, TraceEventType
+import ijson
+
+from varats.experiment.experiment_util import ZippedReportFolder
+from varats.report.tef_report import (
+    TEFReport,
+    TEFReportAggregate,
+    TraceEvent,
+    TraceEventType,
+)
 
 TRACE_EVENT_FORMAT_OUTPUT = """{
     "traceEvents": [{
@@ -207,15 +218,20 @@ class TestTEFReportParser(unittest.TestCase):
     """Tests if the trace-event-format report can be parsed correctly."""
 
     report: TEFReport
+    tef_file: tp.IO[str]
 
     @classmethod
     def setUpClass(cls):
         """Load and prepare TEF report."""
-        with mock.patch(
-            'builtins.open',
-            new=mock.mock_open(read_data=TRACE_EVENT_FORMAT_OUTPUT)
-        ):
-            cls.report = TEFReport(Path("fake_file_path"))
+        # reports are parsed lazily, so the file needs to outlive the setup
+        cls.tef_file = NamedTemporaryFile('w')
+        cls.tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+        cls.tef_file.flush()
+        cls.report = TEFReport(Path(cls.tef_file.name))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tef_file.close()
 
     def test_parse_time_unit(self) -> None:
         """Test if the time unit field is correclty parsed."""
@@ -228,6 +244,104 @@ class TestTEFReportParser(unittest.TestCase):
 
         self.assertEqual(self.report.trace_events[0].name, "Base")
 
+    def test_trace_event_strings_are_shared(self) -> None:
+        """Test if equal event names and categories share one string
+        object."""
+        base_begin = self.report.trace_events[0]
+        base_end = self.report.trace_events[7]
+
+        self.assertIs(base_begin.name, base_end.name)
+        self.assertIs(base_begin.category, base_end.category)
+
+    def test_parse_filtered_trace_events(self) -> None:
+        """Test if only the trace events selected by the filter are parsed."""
+        with NamedTemporaryFile('w') as tef_file:
+            tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+            tef_file.seek(0)
+            report = TEFReport(
+                Path(tef_file.name),
+                event_filter=lambda event: event["name"] == "Base"
+            )
+
+            self.assertEqual(len(report.trace_events), 2)
+            self.assertEqual(
+                report.trace_events[0].event_type,
+                TraceEventType.DURATION_EVENT_BEGIN
+            )
+            self.assertEqual(
+                report.trace_events[1].event_type,
+                TraceEventType.DURATION_EVENT_END
+            )
+            self.assertEqual(report.display_time_unit, "ns")
+
+    def test_iter_trace_events(self) -> None:
+        """Test if iterating over the trace events yields the same events as
+        the parsed list."""
+        with NamedTemporaryFile('w') as tef_file:
+            tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+            tef_file.flush()
+            report = TEFReport(Path(tef_file.name))
+
+            streamed_names = [
+                trace_event.name for trace_event in report.iter_trace_events()
+            ]
+            self.assertEqual([
+                trace_event.name for trace_event in report.trace_events
+            ], streamed_names)
+            self.assertEqual(
+                streamed_names, [
+                    trace_event.name
+                    for trace_event in report.iter_trace_events()
+                ]
+            )
+
+    def test_parse_lazily(self) -> None:
+        """Test if the report file is only parsed when its content is
+        accessed."""
+        with NamedTemporaryFile('w') as tef_file:
+            report = TEFReport(Path(tef_file.name))
+            tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+            tef_file.flush()
+
+            self.assertEqual(report.display_time_unit, "ns")
+            self.assertEqual(len(report.trace_events), 8)
+
+    def test_parse_reads_file_once(self) -> None:
+        """Test if parsing the report fills all fields with a single pass over
+        the file."""
+        with NamedTemporaryFile('w') as tef_file:
+            tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+            tef_file.flush()
+            report = TEFReport(Path(tef_file.name))
+
+            with mock.patch(
+                "varats.report.tef_report.ijson.parse", wraps=ijson.parse
+            ) as parse_mock:
+                report.parse()
+                self.assertEqual(report.display_time_unit, "ns")
+                self.assertEqual(len(report.trace_events), 8)
+
+            parse_mock.assert_called_once()
+
+    def test_aggregate_reports_outlive_aggregate(self) -> None:
+        """Test if reports of an aggregate stay accessible after the aggregate
+        removed its extracted files."""
+        with TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir) / "TEFAggregateTest.zip"
+            with ZippedReportFolder(tmp_file) as tef_reports_dir:
+                with open(
+                    Path(tef_reports_dir) / "tef_report.json", "w"
+                ) as tef_file:
+                    tef_file.write(TRACE_EVENT_FORMAT_OUTPUT)
+
+            aggregate = TEFReportAggregate(tmp_file)
+            report = aggregate.reports()[0]
+            del aggregate
+            gc.collect()
+
+            self.assertEqual(report.display_time_unit, "ns")
+            self.assertEqual(len(report.trace_events), 8)
+
     def test_parse_stack_frames(self) -> None:
         """Test if we correctly parse stack frames."""
         # Currently, not implemented so we should get an exception.
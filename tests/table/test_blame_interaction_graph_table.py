@@ -17,18 +17,64 @@ from varats.tables.blame_interaction_graph_table import (
 from varats.utils.settings import vara_cfg
 
 
+_CIG_HEADER = r"""\begin{tabular}{lrrrrrrrrrrrrrr}
+\toprule
+{} & {commits} & {authors} & {nodes} & {edges} & \multicolumn{4}{c}{node degree} & \multicolumn{3}{c}{node out degree} & \multicolumn{3}{c}{node in degree} \\
+{} & {} & {} & {} & {} & {mean} & {median} & {min} & {max} & {median} & {min} & {max} & {median} & {min} & {max} \\
+\midrule
+"""
+
+_EXPECTED_CIG_TABLE = _CIG_HEADER + r"""xz & 1143 & 16 & 124 & 928 & 14.97 & 8.00 & 1 & 154 & 4.00 & 0 & 64 & 3.00 & 0 & 92 \\
+\bottomrule
+\end{tabular}
+"""
+
+_EXPECTED_AIG_TABLE = _CIG_HEADER + r"""xz & 1143 & 16 & 1 & 0 & 0.00 & 0.00 & 0 & 0 & 0.00 & 0 & 0 & 0.00 & 0 & 0 \\
+\bottomrule
+\end{tabular}
+"""
+
+_EXPECTED_CAIG_TABLE = _CIG_HEADER + r"""xz & 1143 & 16 & 125 & 92 & 1.47 & 1.00 & 0 & 92 & 1.00 & 0 & 1 & 0.00 & 0 & 92 \\
+\bottomrule
+\end{tabular}
+"""
+
+_EXPECTED_AIG_FILE_VS_BLAME_TABLE = r"""\begin{tabular}{lrrrrr}
+{} & {Blame Num Commits} & {Blame Node-deg} & {Author Diff} & {File Num Commits} & {File Node-deg} \\
+{Author} & {} & {} & {} & {} & {} \\
+Alexey Tourbin & nan & nan & nan & 1 & 2 \\
+Ben Boeckel & nan & nan & nan & 1 & 2 \\
+Jim Meyering & nan & nan & nan & 1 & 2 \\
+Lasse Collin & 124.00 & 0.00 & 0.00 & 479 & 6 \\
+\end{tabular}
+"""
+
+
 class TestCSMetricsTable(unittest.TestCase):
     """Test whether case study metrics are collected correctly."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        initialize_projects()
+
+    @staticmethod
+    def _load_paper_config() -> None:
+        """
+        Loads the paper config used by all tests of this class.
+
+        Every test runs in a fresh test environment, so the paper config needs
+        to be loaded again; project discovery is only done once per class.
+        """
+        vara_cfg()["paper_config"]["current_config"
+                                  ] = "test_diff_correlation_overview_table"
+        load_paper_config()
+
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
     )
     def test_cig_metrics_table(self) -> None:
         """Tests the latex booktabs format for the cig metrics table."""
-        vara_cfg()["paper_config"]["current_config"
-                                  ] = "test_diff_correlation_overview_table"
-        initialize_projects()
-        load_paper_config()
+        self._load_paper_config()
 
         # latex booktabs is default format
         table_str = CommitInteractionGraphMetricsTable(
@@ -36,27 +82,14 @@ class TestCSMetricsTable(unittest.TestCase):
             case_study=get_loaded_paper_config().get_all_case_studies()
         ).tabulate(TableFormat.LATEX_BOOKTABS, False)
 
-        self.assertEqual(
-            r"""\begin{tabular}{lrrrrrrrrrrrrrr}
-\toprule
-{} & {commits} & {authors} & {nodes} & {edges} & \multicolumn{4}{c}{node degree} & \multicolumn{3}{c}{node out degree} & \multicolumn{3}{c}{node in degree} \\
-{} & {} & {} & {} & {} & {mean} & {median} & {min} & {max} & {median} & {min} & {max} & {median} & {min} & {max} \\
-\midrule
-xz & 1143 & 16 & 124 & 928 & 14.97 & 8.00 & 1 & 154 & 4.00 & 0 & 64 & 3.00 & 0 & 92 \\
-\bottomrule
-\end{tabular}
-""", table_str
-        )
+        self.assertEqual(_EXPECTED_CIG_TABLE, table_str)
 
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
     )
     def test_aig_metrics_table(self) -> None:
         """Tests the latex booktabs format for the aig metrics table."""
-        vara_cfg()["paper_config"]["current_config"
-                                  ] = "test_diff_correlation_overview_table"
-        initialize_projects()
-        load_paper_config()
+        self._load_paper_config()
 
         # latex booktabs is default format
         table_str = AuthorInteractionGraphMetricsTable(
@@ -64,27 +97,14 @@ xz & 1143 & 16 & 124 & 928 & 14.97 & 8.00 & 1 & 154 & 4.00 & 0 & 64 & 3.00 & 0 &
             case_study=get_loaded_paper_config().get_all_case_studies()
         ).tabulate(TableFormat.LATEX_BOOKTABS, False)
 
-        self.assertEqual(
-            r"""\begin{tabular}{lrrrrrrrrrrrrrr}
-\toprule
-{} & {commits} & {authors} & {nodes} & {edges} & \multicolumn{4}{c}{node degree} & \multicolumn{3}{c}{node out degree} & \multicolumn{3}{c}{node in degree} \\
-{} & {} & {} & {} & {} & {mean} & {median} & {min} & {max} & {median} & {min} & {max} & {median} & {min} & {max} \\
-\midrule
-xz & 1143 & 16 & 1 & 0 & 0.00 & 0.00 & 0 & 0 & 0.00 & 0 & 0 & 0.00 & 0 & 0 \\
-\bottomrule
-\end{tabular}
-""", table_str
-        )
+        self.assertEqual(_EXPECTED_AIG_TABLE, table_str)
 
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
     )
     def test_caig_metrics_table(self) -> None:
         """Tests the latex booktabs format for the caig metrics table."""
-        vara_cfg()["paper_config"]["current_config"
-                                  ] = "test_diff_correlation_overview_table"
-        initialize_projects()
-        load_paper_config()
+        self._load_paper_config()
 
         # latex booktabs is default format
         table_str = CommitAuthorInteractionGraphMetricsTable(
@@ -92,17 +112,7 @@ xz & 1143 & 16 & 1 & 0 & 0.00 & 0.00 & 0 & 0 & 0.00 & 0 & 0 & 0.00 & 0 & 0 \\
             case_study=get_loaded_paper_config().get_all_case_studies()
         ).tabulate(TableFormat.LATEX_BOOKTABS, False)
 
-        self.assertEqual(
-            r"""\begin{tabular}{lrrrrrrrrrrrrrr}
-\toprule
-{} & {commits} & {authors} & {nodes} & {edges} & \multicolumn{4}{c}{node degree} & \multicolumn{3}{c}{node out degree} & \multicolumn{3}{c}{node in degree} \\
-{} & {} & {} & {} & {} & {mean} & {median} & {min} & {max} & {median} & {min} & {max} & {median} & {min} & {max} \\
-\midrule
-xz & 1143 & 16 & 125 & 92 & 1.47 & 1.00 & 0 & 92 & 1.00 & 0 & 1 & 0.00 & 0 & 92 \\
-\bottomrule
-\end{tabular}
-""", table_str
-        )
+        self.assertEqual(_EXPECTED_CAIG_TABLE, table_str)
 
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
@@ -113,10 +123,7 @@ xz & 1143 & 16 & 125 & 92 & 1.47 & 1.00 & 0 & 92 & 1.00 & 0 & 1 & 0.00 & 0 & 92
 
         ci table.
         """
-        vara_cfg()["paper_config"]["current_config"
-                                  ] = "test_diff_correlation_overview_table"
-        initialize_projects()
-        load_paper_config()
+        self._load_paper_config()
 
         # latex booktabs is default format
         table_str = AuthorBlameVsFileDegreesTable(
@@ -124,14 +131,4 @@ xz & 1143 & 16 & 125 & 92 & 1.47 & 1.00 & 0 & 92 & 1.00 & 0 & 1 & 0.00 & 0 & 92
             case_study=get_loaded_paper_config().get_case_studies("xz")[0]
         ).tabulate(TableFormat.LATEX_BOOKTABS, False)
 
-        self.assertEqual(
-            r"""\begin{tabular}{lrrrrr}
-{} & {Blame Num Commits} & {Blame Node-deg} & {Author Diff} & {File Num Commits} & {File Node-deg} \\
-{Author} & {} & {} & {} & {} & {} \\
-Alexey Tourbin & nan & nan & nan & 1 & 2 \\
-Ben Boeckel & nan & nan & nan & 1 & 2 \\
-Jim Meyering & nan & nan & nan & 1 & 2 \\
-Lasse Collin & 124.00 & 0.00 & 0.00 & 479 & 6 \\
-\end{tabular}
-""", table_str
-        )
+        self.assertEqual(_EXPECTED_AIG_FILE_VS_BLAME_TABLE, table_str)
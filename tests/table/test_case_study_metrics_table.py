@@ -13,11 +13,14 @@ from varats.utils.settings import vara_cfg
 class TestCSMetricsTable(unittest.TestCase):
     """Test whether case study metrics are collected correctly."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        initialize_projects()
+
     @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
     def test_one_case_study_latex_booktabs(self) -> None:
         """"Tests the latex booktabs format for the cs overview table."""
         vara_cfg()["paper_config"]["current_config"] = "test_revision_lookup"
-        initialize_projects()
         load_paper_config()
 
         # latex booktabs is default format
@@ -40,7 +43,6 @@ brotli & Compression & 34639 & 848 & 40 & aaa4424d9b \\
     def test_multiple_case_studies_latex_booktabs(self) -> None:
         """"Tests the latex booktabs format for the cs overview table."""
         vara_cfg()["paper_config"]["current_config"] = "test_artefacts_driver"
-        initialize_projects()
         load_paper_config()
 
         # latex booktabs is default format
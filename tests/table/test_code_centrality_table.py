@@ -15,6 +15,10 @@ from varats.utils.settings import vara_cfg
 class TestCSMetricsTable(unittest.TestCase):
     """Test whether case study metrics are collected correctly."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        initialize_projects()
+
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
     )
@@ -23,7 +27,6 @@ class TestCSMetricsTable(unittest.TestCase):
         table."""
         vara_cfg()["paper_config"]["current_config"
                                   ] = "test_diff_correlation_overview_table"
-        initialize_projects()
         load_paper_config()
 
         # latex booktabs is default format
@@ -9,33 +9,41 @@ from varats.tables import diff_correlation_overview_table
 from varats.utils.settings import vara_cfg
 
 
+_EXPECTED_DIFF_CORR_TABLE = r"""\begin{tabular}{lrrrr}
+\toprule
+{} & \multicolumn{4}{c}{xz} \\
+{} & {Churn} & {Num Interactions} & {Num Interacting Commits} & {Num Interacting Authors} \\
+\midrule
+Churn & 1.00 & 1.00 & -1.00 & nan \\
+Num Interactions & 1.00 & 1.00 & -1.00 & nan \\
+Num Interacting Commits & -1.00 & -1.00 & 1.00 & nan \\
+Num Interacting Authors & nan & nan & nan & nan \\
+\bottomrule
+\end{tabular}
+"""
+
+
 class TestDiffCorrelationOverviewTable(unittest.TestCase):
     """Test the DiffCorrelationOverviewTable class."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        initialize_projects()
+
+    @staticmethod
+    def _load_paper_config() -> None:
+        vara_cfg()["paper_config"]["current_config"
+                                  ] = "test_diff_correlation_overview_table"
+        load_paper_config()
+
     @run_in_test_environment(
         UnitTestFixtures.PAPER_CONFIGS, UnitTestFixtures.RESULT_FILES
     )
     def test_table_tex_output(self) -> None:
         """Check whether the table produces the correct tex output."""
-        vara_cfg()["paper_config"]["current_config"
-                                  ] = "test_diff_correlation_overview_table"
-        initialize_projects()
-        load_paper_config()
+        self._load_paper_config()
         table_str = diff_correlation_overview_table.DiffCorrelationOverviewTable(
             TableConfig.from_kwargs(view=False)
         ).tabulate(TableFormat.LATEX_BOOKTABS, False)
 
-        self.assertEqual(
-            r"""\begin{tabular}{lrrrr}
-\toprule
-{} & \multicolumn{4}{c}{xz} \\
-{} & {Churn} & {Num Interactions} & {Num Interacting Commits} & {Num Interacting Authors} \\
-\midrule
-Churn & 1.00 & 1.00 & -1.00 & nan \\
-Num Interactions & 1.00 & 1.00 & -1.00 & nan \\
-Num Interacting Commits & -1.00 & -1.00 & 1.00 & nan \\
-Num Interacting Authors & nan & nan & nan & nan \\
-\bottomrule
-\end{tabular}
-""", table_str
-        )
+        self.assertEqual(_EXPECTED_DIFF_CORR_TABLE, table_str)
@@ -13,6 +13,7 @@ from varats.ts_utils.click_param_types import (
     TypedChoice,
     TypedMultiChoice,
     EnumChoice,
+    LazyChoice,
 )
 from varats.utils.settings import vara_cfg
 
@@ -82,6 +83,17 @@ class TestChoiceTypes(unittest.TestCase):
         choice = TypedMultiChoice({"a": [0], "b": [1], "c": [2]})
         self.assertEqual([1, 0], choice.convert("b, a", None, None))
 
+    def test_lazy_choice_convert(self):
+        create_choice = mock.Mock(
+            return_value=TypedChoice({"a": 0, "b": 1, "c": 2})
+        )
+        choice = LazyChoice(create_choice)
+        create_choice.assert_not_called()
+
+        self.assertEqual(1, choice.convert("b", None, None))
+        self.assertEqual(2, choice.convert("c", None, None))
+        create_choice.assert_called_once()
+
     def test_enum_choice_convert_str(self):
         choice = EnumChoice(ExampleTestEnum)
         self.assertEqual(ExampleTestEnum.B, choice.convert("B", None, None))
@@ -1,10 +1,9 @@
 """Test VaRA Experiment utilities."""
 import os
-import shutil
-import tempfile
 import typing as tp
 import unittest
 import unittest.mock as mock
+import zipfile
 from pathlib import Path
 
 import benchbuild.utils.actions as actions
@@ -13,7 +12,7 @@ from benchbuild.project import Project
 
 import varats.experiment.experiment_util as EU
 from tests.test_helper import BBTestSource
-from tests.test_utils import run_in_test_environment
+from tests.test_utils import run_in_test_environment, test_environment
 from varats.data.reports.commit_report import CommitReport as CR
 from varats.project.project_util import BinaryType, ProjectBinaryWrapper
 from varats.project.varats_project import VProject
@@ -99,7 +98,7 @@ class TestResultFolderAccess(unittest.TestCase):
 class TestVersionExperiment(unittest.TestCase):
     """Test VersionExperiments sampling behaviour."""
 
-    tmp_path: tempfile.TemporaryDirectory
+    test_env: tp.ContextManager[Path]
     vers_expr: MockExperiment
 
     @classmethod
@@ -110,11 +109,22 @@ class TestVersionExperiment(unittest.TestCase):
             'rev1000000', 'rev2000000', 'rev3000000', 'rev4000000', 'rev5000000'
         ]
 
+        # The sampling tests share a single test environment; setUp resets
+        # all config keys they modify.
+        cls.test_env = test_environment()
+        cls.test_env.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.test_env.__exit__(None, None, None)
+
     def setUp(self):
         """Set config to initial values."""
         self.rev_list = [
             'rev1000000', 'rev2000000', 'rev3000000', 'rev4000000', 'rev5000000'
         ]
+        self.prepare_vara_config(vara_cfg())
+        bb_cfg()["versions"]["full"] = False
 
     @staticmethod
     def prepare_vara_config(vara_cfg: s.Configuration) -> None:
@@ -145,10 +155,8 @@ class TestVersionExperiment(unittest.TestCase):
             }
         }
 
-    @run_in_test_environment()
     def test_sample_limit(self):
         """Test if base_hash is loaded correctly."""
-        self.prepare_vara_config(vara_cfg())
         self.assertEqual(vara_cfg()["experiment"]["sample_limit"].value, None)
         self.assertEqual(
             # pylint: disable=protected-access
@@ -161,7 +169,6 @@ class TestVersionExperiment(unittest.TestCase):
             len(self.vers_expr._sample_num_versions(self.rev_list)), 3
         )
 
-    @run_in_test_environment()
     def test_without_versions(self):
         """Test if we get the correct revision if no VaRA modifications are
         enabled."""
@@ -170,11 +177,9 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(sample_gen[0]["test_source"].version, "rev1000000")
         self.assertEqual(len(sample_gen), 1)
 
-    @run_in_test_environment()
     @mock.patch('varats.experiment.experiment_util.revs.get_tagged_revisions')
     def test_only_whitelisting_one(self, mock_get_tagged_revisions):
         """Test if we can whitelist file status."""
-        self.prepare_vara_config(vara_cfg())
         bb_cfg()["versions"]["full"] = True
         # Revision not in set
         mock_get_tagged_revisions.return_value = \
@@ -188,11 +193,9 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(len(sample_gen), 1)
         mock_get_tagged_revisions.assert_called()
 
-    @run_in_test_environment()
     @mock.patch('varats.experiment.experiment_util.revs.get_tagged_revisions')
     def test_only_whitelisting_many(self, mock_get_tagged_revisions):
         """Test if we can whitelist file status."""
-        self.prepare_vara_config(vara_cfg())
         bb_cfg()["versions"]["full"] = True
         # Revision not in set
         mock_get_tagged_revisions.return_value = \
@@ -210,11 +213,9 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(len(sample_gen), 3)
         mock_get_tagged_revisions.assert_called()
 
-    @run_in_test_environment()
     @mock.patch('varats.experiment.experiment_util.revs.get_tagged_revisions')
     def test_only_blacklisting_one(self, mock_get_tagged_revisions):
         """Test if we can blacklist file status."""
-        self.prepare_vara_config(vara_cfg())
         bb_cfg()["versions"]["full"] = True
         # Revision not in set
         mock_get_tagged_revisions.return_value = \
@@ -231,11 +232,9 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(len(sample_gen), 4)
         mock_get_tagged_revisions.assert_called()
 
-    @run_in_test_environment()
     @mock.patch('varats.experiment.experiment_util.revs.get_tagged_revisions')
     def test_only_blacklisting_many(self, mock_get_tagged_revisions):
         """Test if we can blacklist file status."""
-        self.prepare_vara_config(vara_cfg())
         bb_cfg()["versions"]["full"] = True
         # Revision not in set
         mock_get_tagged_revisions.return_value = \
@@ -252,11 +251,9 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(len(sample_gen), 2)
         mock_get_tagged_revisions.assert_called()
 
-    @run_in_test_environment()
     @mock.patch('varats.experiment.experiment_util.revs.get_tagged_revisions')
     def test_white_overwrite_blacklisting(self, mock_get_tagged_revisions):
         """Test if whitelist overwrites blacklist."""
-        self.prepare_vara_config(vara_cfg())
         bb_cfg()["versions"]["full"] = True
         # Revision not in set
         mock_get_tagged_revisions.return_value = \
@@ -271,6 +268,16 @@ class TestVersionExperiment(unittest.TestCase):
         self.assertEqual(len(sample_gen), 1)
         mock_get_tagged_revisions.assert_called()
 
+
+class TestResultFilepathCreation(unittest.TestCase):
+    """Test creation of result file paths for VersionExperiments."""
+
+    vers_expr: MockExperiment
+
+    @classmethod
+    def setUpClass(cls):
+        cls.vers_expr = MockExperiment()
+
     @run_in_test_environment()
     def test_create_success_result_filepath(self):
         """Checks if we correctly create new success result files."""
@@ -350,10 +357,25 @@ class TestZippedReportFolder(unittest.TestCase):
 
         self.assertTrue(test_zip.exists())
 
-        with tempfile.TemporaryDirectory() as tmp_result_dir:
-            shutil.unpack_archive(test_zip, extract_dir=Path(tmp_result_dir))
+        with zipfile.ZipFile(test_zip) as zipped_folder:
+            self.assertIn('foo.txt', zipped_folder.namelist())
+            self.assertEqual(zipped_folder.read('foo.txt'), b'content')
+
+    @run_in_test_environment()
+    def test_zipped_result_folder_nested_folders(self):
+        """Checks if nested folders are stored relative to the report
+        folder."""
+        test_tmp_folder = Path(os.getcwd())
+
+        test_zip = test_tmp_folder / 'FooBarNested.zip'
+
+        with EU.ZippedReportFolder(test_zip) as output_folder:
+            nested_folder = Path(output_folder) / 'bar'
+            nested_folder.mkdir()
+            with open(nested_folder / 'foo.txt', 'w') as output_file:
+                output_file.write('content')
 
-            should_be_generated_file = Path(tmp_result_dir) / 'foo.txt'
-            self.assertTrue(should_be_generated_file.exists())
-            with open(should_be_generated_file, 'r') as foo_file:
-                self.assertEqual(foo_file.readline(), 'content')
+        with zipfile.ZipFile(test_zip) as zipped_folder:
+            self.assertEqual(['bar/', 'bar/foo.txt'],
+                             zipped_folder.namelist())
+            self.assertEqual(zipped_folder.read('bar/foo.txt'), b'content')
@@ -2,6 +2,7 @@
 import unittest
 from pathlib import Path
 
+import pygit2
 from benchbuild.utils.revision_ranges import RevisionRange
 
 from varats.project.project_util import (
@@ -29,15 +30,32 @@ from varats.utils.git_util import (
     get_submodule_head,
     get_head_commit,
     calc_code_churn_range,
+    create_churn_lookup_helper,
 )
 
+_BROTLI_REVISIONS_BETWEEN = frozenset({
+    FullCommitHash("5692e422da6af1e991f9182345d58df87866bc5e"),
+    FullCommitHash("2f9277ff2f2d0b4113b1ffd9753cc0f6973d354a"),
+    FullCommitHash("63be8a99401992075c23e99f7c84de1c653e39e2"),
+    FullCommitHash("2a51a85aa86abb4c294c65fab57f3d9c69f10080")
+})
+
 
 class TestGitInteractionHelpers(unittest.TestCase):
     """Test if the different git helper classes work."""
 
+    brotli_repo: pygit2.Repository
+    brotli_repo_path: Path
+    fpcsc_repo_path: Path
+
     @classmethod
     def setUpClass(cls):
         initialize_projects()
+        cls.brotli_repo = get_local_project_git("brotli")
+        cls.brotli_repo_path = get_local_project_git_path("brotli")
+        cls.fpcsc_repo_path = get_local_project_git_path(
+            "FeaturePerfCSCollection"
+        )
 
     def test_is_commit_hash(self) -> None:
         """Check if we can correctly identify commit hashes."""
@@ -57,17 +75,17 @@ class TestGitInteractionHelpers(unittest.TestCase):
 
     def test_get_current_branch(self):
         """Check if we can correctly retrieve the current branch of a repo."""
-        repo = get_local_project_git("brotli")
+        repo = self.brotli_repo
 
-        repo.checkout(repo.lookup_branch('master'))
+        # only touch the working tree if master is not checked out already
+        if repo.head_is_detached or repo.head.shorthand != 'master':
+            repo.checkout(repo.lookup_branch('master'))
 
         self.assertEqual(get_current_branch(repo.workdir), 'master')
 
     def test_get_initial_commit(self) -> None:
         """Check if we can correctly retrieve the inital commit of a repo."""
-        repo_path = get_local_project_git_path("FeaturePerfCSCollection")
-
-        inital_commit = get_initial_commit(repo_path)
+        inital_commit = get_initial_commit(self.fpcsc_repo_path)
 
         self.assertEqual(
             FullCommitHash("4d84c8f80ec2db3aaa880d323f7666752c4be51d"),
@@ -76,9 +94,7 @@ class TestGitInteractionHelpers(unittest.TestCase):
 
     def test_get_initial_commit_with_specified_path(self) -> None:
         """Check if we can correctly retrieve the inital commit of a repo."""
-        inital_commit = get_initial_commit(
-            get_local_project_git_path("FeaturePerfCSCollection")
-        )
+        inital_commit = get_initial_commit(self.fpcsc_repo_path)
 
         self.assertEqual(
             FullCommitHash("4d84c8f80ec2db3aaa880d323f7666752c4be51d"),
@@ -87,38 +103,25 @@ class TestGitInteractionHelpers(unittest.TestCase):
 
     def test_get_all_revisions_between_full(self):
         """Check if the correct all revisions are correctly found."""
-        repo_path = get_local_project_git_path("brotli")
         revs = get_all_revisions_between(
             '5692e422da6af1e991f9182345d58df87866bc5e',
             '2f9277ff2f2d0b4113b1ffd9753cc0f6973d354a', FullCommitHash,
-            repo_path
+            self.brotli_repo_path
         )
 
-        self.assertSetEqual(
-            set(revs), {
-                FullCommitHash("5692e422da6af1e991f9182345d58df87866bc5e"),
-                FullCommitHash("2f9277ff2f2d0b4113b1ffd9753cc0f6973d354a"),
-                FullCommitHash("63be8a99401992075c23e99f7c84de1c653e39e2"),
-                FullCommitHash("2a51a85aa86abb4c294c65fab57f3d9c69f10080")
-            }
-        )
+        self.assertCountEqual(revs, _BROTLI_REVISIONS_BETWEEN)
 
     def test_get_all_revisions_between_short(self):
         """Check if the correct all revisions are correctly found."""
-        repo_path = get_local_project_git_path("brotli")
         revs = get_all_revisions_between(
             '5692e422da6af1e991f9182345d58df87866bc5e',
             '2f9277ff2f2d0b4113b1ffd9753cc0f6973d354a', ShortCommitHash,
-            repo_path
+            self.brotli_repo_path
         )
 
-        self.assertSetEqual(
-            set(revs), {
-                ShortCommitHash("5692e422da"),
-                ShortCommitHash("2f9277ff2f"),
-                ShortCommitHash("63be8a9940"),
-                ShortCommitHash("2a51a85aa8")
-            }
+        self.assertCountEqual(
+            revs,
+            [rev.to_short_commit_hash() for rev in _BROTLI_REVISIONS_BETWEEN]
         )
 
     def test_get_submodule_head(self):
@@ -153,9 +156,8 @@ class TestGitInteractionHelpers(unittest.TestCase):
     def test_get_commits_before_timestamp(self) -> None:
         """Check if we can correctly determine the commits before a specific
         timestamp."""
-        project_repo = get_local_project_git_path('brotli')
         brotli_commits_after = get_commits_before_timestamp(
-            '2013-10-24', project_repo
+            '2013-10-24', self.brotli_repo_path
         )
 
         # newest found commit should be
@@ -172,9 +174,8 @@ class TestGitInteractionHelpers(unittest.TestCase):
     def test_get_commits_after_timestamp(self) -> None:
         """Check if we can correctly determine the commits after a specific
         timestamp."""
-        project_repo = get_local_project_git_path('brotli')
         brotli_commits_after = get_commits_after_timestamp(
-            '2021-01-01', project_repo
+            '2021-01-01', self.brotli_repo_path
         )
 
         # oldest found commit should be
@@ -191,7 +192,7 @@ class TestGitInteractionHelpers(unittest.TestCase):
     def test_contains_source_code_without(self) -> None:
         """Check if we can correctly identify commits with source code."""
         churn_conf = ChurnConfig.create_c_style_languages_config()
-        project_git_path = get_local_project_git_path('brotli')
+        project_git_path = self.brotli_repo_path
 
         self.assertFalse(
             contains_source_code(
@@ -215,7 +216,7 @@ class TestGitInteractionHelpers(unittest.TestCase):
     def test_contains_source_code_with(self) -> None:
         """Check if we can correctly identify commits without source code."""
         churn_conf = ChurnConfig.create_c_style_languages_config()
-        project_git_path = get_local_project_git_path('brotli')
+        project_git_path = self.brotli_repo_path
 
         self.assertTrue(
             contains_source_code(
@@ -405,21 +406,36 @@ class TestCommitRepoPair(unittest.TestCase):
             "foo_repo[4200000000000000000000000000000000000000]"
         )
 
+    def test_unpickle_recomputes_hash(self):
+        """Tests that unpickled pairs do not keep a hash from another
+        process."""
+        self.assertNotIn("_CommitRepoPair__hash", self.cr_pair.__getstate__())
+
+        # simulate a pair pickled with a different hash seed
+        restored = CommitRepoPair.__new__(CommitRepoPair)
+        restored.__setstate__({
+            **self.cr_pair.__getstate__(), "_CommitRepoPair__hash": 42
+        })
+
+        self.assertEqual(restored, self.cr_pair)
+        self.assertIn(restored, {self.cr_pair})
+
 
 class TestCodeChurnCalculation(unittest.TestCase):
     """Test if we correctly compute code churn."""
 
+    repo_path: Path
+
     @classmethod
     def setUpClass(cls):
         initialize_projects()
+        cls.repo_path = get_local_project_git_path("brotli")
 
     def test_one_commit_diff(self):
         """Check if we get the correct code churn for a single commit."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         files_changed, insertions, deletions = calc_commit_code_churn(
-            repo_path,
+            self.repo_path,
             FullCommitHash("0c5603e07bed1d5fbb45e38f9bdf0e4560fde3f0"),
             ChurnConfig.create_c_style_languages_config()
         )
@@ -431,10 +447,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
     def test_one_commit_diff_2(self):
         """Check if we get the correct code churn for a single commit."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         files_changed, insertions, deletions = calc_commit_code_churn(
-            repo_path,
+            self.repo_path,
             FullCommitHash("fc823290a76a260b7ba6f47ab5f52064a0ce19ff"),
             ChurnConfig.create_c_style_languages_config()
         )
@@ -446,10 +460,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
     def test_one_commit_diff_3(self):
         """Check if we get the correct code churn for a single commit."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         files_changed, insertions, deletions = calc_commit_code_churn(
-            repo_path,
+            self.repo_path,
             FullCommitHash("924b2b2b9dc54005edbcd85a1b872330948cdd9e"),
             ChurnConfig.create_c_style_languages_config()
         )
@@ -462,10 +474,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
         """Check if we get the correct code churn for a single commit but only
         consider code changes."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         files_changed, insertions, deletions = calc_commit_code_churn(
-            repo_path,
+            self.repo_path,
             FullCommitHash("f503cb709ca181dbf5c73986ebac1b18ac5c9f63"),
             ChurnConfig.create_c_style_languages_config()
         )
@@ -477,10 +487,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
     def test_start_with_initial_commit(self):
         """Check if the initial commit is handled correctly."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         churn = calc_code_churn_range(
-            repo_path, ChurnConfig.create_c_style_languages_config(),
+            self.repo_path, ChurnConfig.create_c_style_languages_config(),
             FullCommitHash("8f30907d0f2ef354c2b31bdee340c2b11dda0fb0"),
             FullCommitHash("8f30907d0f2ef354c2b31bdee340c2b11dda0fb0")
         )
@@ -494,10 +502,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
     def test_end_only(self):
         """Check if churn is correct if only end range is set."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         churn = calc_code_churn_range(
-            repo_path, ChurnConfig.create_c_style_languages_config(), None,
+            self.repo_path, ChurnConfig.create_c_style_languages_config(), None,
             FullCommitHash("645552217219c2877780ba4d7030044ec62d8255")
         )
 
@@ -517,10 +523,8 @@ class TestCodeChurnCalculation(unittest.TestCase):
     def test_commit_range(self):
         """Check if we get the correct code churn for commit range."""
 
-        repo_path = get_local_project_git_path("brotli")
-
         files_changed, insertions, deletions = calc_code_churn(
-            repo_path,
+            self.repo_path,
             FullCommitHash("36ac0feaf9654855ee090b1f042363ecfb256f31"),
             FullCommitHash("924b2b2b9dc54005edbcd85a1b872330948cdd9e"),
             ChurnConfig.create_c_style_languages_config()
@@ -530,16 +534,43 @@ class TestCodeChurnCalculation(unittest.TestCase):
         self.assertEqual(insertions, 49)
         self.assertEqual(deletions, 11)
 
+    def test_churn_lookup_helper(self):
+        """Check if the churn lookup returns the same churn as the single
+        commit calculation."""
+        churn_lookup = create_churn_lookup_helper(
+            "brotli", ChurnConfig.create_c_style_languages_config()
+        )
+
+        self.assertEqual(
+            churn_lookup(
+                CommitRepoPair(
+                    FullCommitHash("0c5603e07bed1d5fbb45e38f9bdf0e4560fde3f0"),
+                    "brotli"
+                )
+            ), (1, 2, 2)
+        )
+        self.assertEqual(
+            churn_lookup(
+                CommitRepoPair(
+                    FullCommitHash("924b2b2b9dc54005edbcd85a1b872330948cdd9e"),
+                    "brotli"
+                )
+            ), (3, 38, 7)
+        )
+
 
 class TestRevisionBinaryMap(unittest.TestCase):
     """Test if we can correctly setup and use the RevisionBinaryMap."""
 
+    repo_path: Path
     rv_map: RevisionBinaryMap
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.repo_path = get_local_project_git_path("FeaturePerfCSCollection")
+
     def setUp(self) -> None:
-        self.rv_map = RevisionBinaryMap(
-            get_local_project_git_path("FeaturePerfCSCollection")
-        )
+        self.rv_map = RevisionBinaryMap(self.repo_path)
 
     def test_specification_of_always_valid_binaries(self) -> None:
         """Check if we can add binaries to the map."""
@@ -614,3 +645,23 @@ class TestRevisionBinaryMap(unittest.TestCase):
 
         test_query = self.rv_map[ShortCommitHash("745424e3ae")]
         self.assertSetEqual({x.name for x in test_query}, {"SingleLocalSimple"})
+
+    def test_binary_lookup_after_adding_range(self) -> None:
+        """Check if binaries specified after a lookup are considered by later
+        lookups."""
+        self.rv_map.specify_binary(
+            "build/bin/SingleLocalSimple", BinaryType.EXECUTABLE
+        )
+
+        test_query = self.rv_map[ShortCommitHash("162db88346")]
+        self.assertSetEqual({x.name for x in test_query}, {"SingleLocalSimple"})
+
+        self.rv_map.specify_binary(
+            "build/bin/SingleLocalMultipleRegions",
+            BinaryType.EXECUTABLE,
+            only_valid_in=RevisionRange("162db88346", "master")
+        )
+
+        test_query = self.rv_map[ShortCommitHash("162db88346")]
+        self.assertSetEqual({x.name for x in test_query},
+                            {"SingleLocalSimple", "SingleLocalMultipleRegions"})
@@ -1,11 +1,12 @@
 """Test VaRA project utilities."""
+import os
 import typing as tp
 import unittest
 from os.path import isdir
 from pathlib import Path
 
-from benchbuild.utils.cmd import git, mkdir
-from plumbum import local
+import pygit2
+from benchbuild.utils.cmd import mkdir
 
 from tests.test_utils import run_in_test_environment, UnitTestFixtures
 from varats.project.project_util import (
@@ -24,11 +25,24 @@ from varats.ts_utils.project_sources import (
 from varats.utils.settings import create_new_varats_config, bb_cfg
 
 
+def _short_head_hash(repo_path: Path) -> str:
+    """Reads the abbreviated HEAD commit of a repository without running
+    git."""
+    return str(pygit2.Repository(str(repo_path)).head.target)[:7]
+
+
+def _sub_dir_names(path: Path) -> tp.Set[str]:
+    """Lists the names of all directories directly inside ``path`` with a
+    single directory scan."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
 class TestProjectLookup(unittest.TestCase):
     """Tests different project lookup methods."""
 
     @classmethod
-    def setUp(cls) -> None:
+    def setUpClass(cls) -> None:
         """Initialize all projects before running tests."""
         initialize_projects()
 
@@ -47,12 +61,12 @@ class TestProjectLookup(unittest.TestCase):
 
     def test_project_iteration(self) -> None:
         """Check if we can iterate over loaded vara projects."""
-        found_gravity = False
-        for prj_cls in get_loaded_vara_projects():
-            if prj_cls.NAME == "gravity":
-                found_gravity = True
-
-        self.assertTrue(found_gravity)
+        self.assertTrue(
+            any(
+                prj_cls.NAME == "gravity"
+                for prj_cls in get_loaded_vara_projects()
+            )
+        )
 
 
 class TestVaraTestRepoSource(unittest.TestCase):
@@ -61,13 +75,14 @@ class TestVaraTestRepoSource(unittest.TestCase):
 
     revision: tp.ClassVar[str]
     bb_result_report_path: tp.ClassVar[Path]
+    version_target_dir: tp.ClassVar[str]
     bb_result_lib_path: tp.ClassVar[Path]
     elementalist: tp.ClassVar[VaraTestRepoSource]
     fire_lib: tp.ClassVar[VaraTestRepoSubmodule]
     water_lib: tp.ClassVar[VaraTestRepoSubmodule]
 
     @classmethod
-    def setUp(cls) -> None:
+    def setUpClass(cls) -> None:
         """Define a multi library example repo."""
 
         cls.revision = "e64923e69e"
@@ -75,6 +90,11 @@ class TestVaraTestRepoSource(unittest.TestCase):
         cls.bb_result_report_path = Path(
             "benchbuild/results/GenerateBlameReport"
         )
+        cls.version_target_dir = (
+            f"{cls.bb_result_report_path}/"
+            f"TwoLibsOneProjectInteractionDiscreteLibsSingleProject"
+            f"-cpp_projects@{cls.revision}"
+        )
         cls.bb_result_lib_path = Path(
             cls.bb_result_report_path /
             f"TwoLibsOneProjectInteractionDiscreteLibsSingle"
@@ -124,10 +144,7 @@ class TestVaraTestRepoSource(unittest.TestCase):
         mkdir("-p", self.bb_result_report_path)
 
         self.elementalist.version(
-            f"{self.bb_result_report_path}/"
-            f"TwoLibsOneProjectInteractionDiscreteLibsSingleProject"
-            f"-cpp_projects@{self.revision}",
-            version=self.revision
+            self.version_target_dir, version=self.revision
         )
 
         # Are directories present?
@@ -137,32 +154,22 @@ class TestVaraTestRepoSource(unittest.TestCase):
                 f"TwoLibsOneProjectInteractionDiscreteLibsSingleProject"
             )
         )
-        self.assertTrue(isdir(self.bb_result_lib_path))
-        self.assertTrue(isdir(self.bb_result_lib_path / "Elementalist"))
-        self.assertTrue(isdir(self.bb_result_lib_path / "fire_lib"))
-        self.assertTrue(isdir(self.bb_result_lib_path / "water_lib"))
-        self.assertTrue(
-            isdir(
-                self.bb_result_lib_path / "Elementalist" / "external" /
-                "fire_lib"
-            )
-        )
-        self.assertTrue(
-            isdir(
-                self.bb_result_lib_path / "Elementalist" / "external" /
-                "water_lib"
-            )
+        lib_dirs = _sub_dir_names(self.bb_result_lib_path)
+        for lib_name in ("Elementalist", "fire_lib", "water_lib"):
+            self.assertIn(lib_name, lib_dirs)
+
+        external_dirs = _sub_dir_names(
+            self.bb_result_lib_path / "Elementalist" / "external"
         )
+        for lib_name in ("fire_lib", "water_lib"):
+            self.assertIn(lib_name, external_dirs)
 
     @run_in_test_environment(UnitTestFixtures.TEST_PROJECTS)
     def test_vara_test_repo_gitted_renaming(self) -> None:
         """Test if the .gitted files are correctly renamed back to their
         original git name."""
         self.elementalist.version(
-            f"{self.bb_result_report_path}/"
-            f"TwoLibsOneProjectInteractionDiscreteLibsSingleProject"
-            f"-cpp_projects@{self.revision}",
-            version=self.revision
+            self.version_target_dir, version=self.revision
         )
 
         # Are .gitted files correctly renamed?
@@ -180,36 +187,23 @@ class TestVaraTestRepoSource(unittest.TestCase):
         """Test if the repositories are checked out at the specified
         revision."""
         self.elementalist.version(
-            f"{self.bb_result_report_path}/"
-            f"TwoLibsOneProjectInteractionDiscreteLibsSingleProject"
-            f"-cpp_projects@{self.revision}",
-            version=self.revision
+            self.version_target_dir, version=self.revision
         )
 
         # Are repositories checked out at correct commit hash?
-        with local.cwd(self.bb_result_lib_path / "Elementalist"):
-            self.assertEqual(
-                self.revision[:7],
-                git('rev-parse', '--short', 'HEAD').rstrip()
-            )
-
-        with local.cwd(self.bb_result_lib_path / "fire_lib"):
-            self.assertEqual(
-                "ead5e00",
-                git('rev-parse', '--short', 'HEAD').rstrip()
-            )
-
-        with local.cwd(self.bb_result_lib_path / "water_lib"):
-            self.assertEqual(
-                "58ec513",
-                git('rev-parse', '--short', 'HEAD').rstrip()
-            )
-
-        with local.cwd(self.bb_result_lib_path / "earth_lib"):
-            self.assertEqual(
-                "1db6fbe",
-                git('rev-parse', '--short', 'HEAD').rstrip()
-            )
+        self.assertEqual(
+            self.revision[:7],
+            _short_head_hash(self.bb_result_lib_path / "Elementalist")
+        )
+        self.assertEqual(
+            "ead5e00", _short_head_hash(self.bb_result_lib_path / "fire_lib")
+        )
+        self.assertEqual(
+            "58ec513", _short_head_hash(self.bb_result_lib_path / "water_lib")
+        )
+        self.assertEqual(
+            "1db6fbe", _short_head_hash(self.bb_result_lib_path / "earth_lib")
+        )
 
     def test_if_project_names_are_well_formed(self) -> None:
         """Tests if project names are well-formed, e.g., they must not contain a
@@ -11,6 +11,7 @@ setup(
     tests_require=["pytest", "pytest-cov"],
     install_requires=[
         "benchbuild>=6.4.0",
+        "ijson>=3.1.4",
         "plumbum>=1.6.6",
         "PyGithub>=1.47",
         "Cryptography<37.0.0",
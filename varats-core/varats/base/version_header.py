@@ -13,8 +13,15 @@ class WrongYamlFileType(Exception):
     """Exception raised for miss matches of the file type."""
 
     def __init__(self, expected_type: str, actual_type: str) -> None:
-        super().__init__(
-            f"Expected FileType: '{expected_type}' but got '{actual_type}'"
+        # the message is only formatted when the exception is printed
+        super().__init__(expected_type, actual_type)
+        self.expected_type = expected_type
+        self.actual_type = actual_type
+
+    def __str__(self) -> str:
+        return (
+            f"Expected FileType: '{self.expected_type}' "
+            f"but got '{self.actual_type}'"
         )
 
 
@@ -22,9 +29,15 @@ class WrongYamlFileVersion(Exception):
     """Exception raised for miss matches of the file version."""
 
     def __init__(self, expected_version: int, actual_version: int):
-        super().__init__(
-            f"Expected minimal version: '{expected_version}' " +
-            f"but got version '{actual_version}'"
+        # the message is only formatted when the exception is printed
+        super().__init__(expected_version, actual_version)
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+    def __str__(self) -> str:
+        return (
+            f"Expected minimal version: '{self.expected_version}' "
+            f"but got version '{self.actual_version}'"
         )
 
 
@@ -39,12 +52,16 @@ class VersionHeader():
     """VersionHeader describing the type and version of the following yaml
     file."""
 
+    __slots__ = ('__doc_type', '__version')
+
     def __init__(self, yaml_doc: tp.Dict[str, tp.Any]) -> None:
-        if 'DocType' not in yaml_doc or 'Version' not in yaml_doc:
-            raise NoVersionHeader()
+        try:
+            doc_type, version = yaml_doc['DocType'], yaml_doc['Version']
+        except (KeyError, TypeError) as err:
+            raise NoVersionHeader() from err
 
-        self.__doc_type = str(yaml_doc['DocType'])
-        self.__version = int(yaml_doc['Version'])
+        self.__doc_type = str(doc_type)
+        self.__version = int(version)
 
     @classmethod
     def from_yaml_doc(cls, yaml_doc: tp.Dict[str, tp.Any]) -> 'VersionHeader':
@@ -68,8 +85,11 @@ class VersionHeader():
             doc_type: type of the document that should follow the version header
             version: the current version number
         """
-        yaml_doc = {'DocType': doc_type, 'Version': version}
-        return cls(yaml_doc)
+        # no need to go through the yaml dict for known values
+        version_header = cls.__new__(cls)
+        version_header.__doc_type = str(doc_type)
+        version_header.__version = int(version)
+        return version_header
 
     @property
     def doc_type(self) -> str:
@@ -83,7 +103,7 @@ class VersionHeader():
         Args:
             type_name: of the possible following yaml document
         """
-        return type_name == self.doc_type
+        return type_name == self.__doc_type
 
     def raise_if_not_type(self, type_name: str) -> None:
         """
@@ -94,7 +114,7 @@ class VersionHeader():
             type_name: of the possible following yaml document
         """
         if not self.is_type(type_name):
-            raise WrongYamlFileType(type_name, self.doc_type)
+            raise WrongYamlFileType(type_name, self.__doc_type)
 
     @property
     def version(self) -> int:
@@ -109,12 +129,9 @@ class VersionHeader():
         Args:
             version_bound: minimal version that is expected
         """
-        if self.version < version_bound:
-            raise WrongYamlFileVersion(version_bound, self.version)
+        if self.__version < version_bound:
+            raise WrongYamlFileVersion(version_bound, self.__version)
 
     def get_dict(self) -> tp.Dict[str, tp.Union[str, int]]:
         """Returns the version header as a dict."""
-        doc: tp.Dict[str, tp.Union[str, int]] = {}
-        doc['DocType'] = self.__doc_type
-        doc['Version'] = self.__version
-        return doc
+        return {'DocType': self.__doc_type, 'Version': self.__version}
@@ -2,12 +2,12 @@
 
 import os
 import random
-import shutil
 import sys
 import tempfile
 import textwrap
 import traceback
 import typing as tp
+import zipfile
 from abc import abstractmethod
 from pathlib import Path
 from types import TracebackType
@@ -21,7 +21,7 @@ from benchbuild import source
 from benchbuild.experiment import Experiment
 from benchbuild.project import Project
 from benchbuild.utils.actions import Step, MultiStep, StepResult, run_any_child
-from benchbuild.utils.cmd import prlimit, mkdir
+from benchbuild.utils.cmd import prlimit
 from plumbum.commands import ProcessExecutionError
 
 import varats.revision.revisions as revs
@@ -55,14 +55,16 @@ def get_varats_result_folder(project: Project) -> Path:
     """
     result_folder_template = "{result_dir}/{project_dir}"
 
-    vara_result_folder = result_folder_template.format(
-        result_dir=str(bb_cfg()["varats"]["outfile"]),
-        project_dir=str(project.name)
+    vara_result_folder = Path(
+        result_folder_template.format(
+            result_dir=str(bb_cfg()["varats"]["outfile"]),
+            project_dir=str(project.name)
+        )
     )
 
-    mkdir("-p", vara_result_folder)
+    vara_result_folder.mkdir(parents=True, exist_ok=True)
 
-    return Path(vara_result_folder)
+    return vara_result_folder
 
 
 class PEErrorHandler():
@@ -474,12 +476,29 @@ class ZippedReportFolder(TempDir):
     ) -> None:
         # Don't create an empty zip archive.
         if os.listdir(self.name):
-            shutil.make_archive(
-                str(self.__result_report_name), "zip", Path(self.name)
-            )
+            self.__create_archive()
 
         super().__exit__(exc_type, exc_value, exc_traceback)
 
+    def __create_archive(self) -> None:
+        """
+        Compress the content of the folder into the report zip archive.
+
+        Reports are mostly large trace files, so we use the fastest deflate
+        level to keep compression from stalling the experiment step.
+        """
+        with zipfile.ZipFile(
+            f"{self.__result_report_name}.zip",
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=1
+        ) as archive:
+            for dir_path, dir_names, file_names in os.walk(self.name):
+                dir_names.sort()
+                for name in dir_names + sorted(file_names):
+                    file_path = Path(dir_path) / name
+                    archive.write(file_path, file_path.relative_to(self.name))
+
 
 @runtime_checkable
 class NeedsOutputFolder(Protocol):
@@ -56,9 +56,8 @@ def _is_vara_project(project_key: str) -> bool:
     >>> _is_vara_project("BZip2/gentoo")
     False
     """
-    return any(
-        project_key.endswith(x)
-        for x in ("c_projects", "cpp_projects", "test_projects", "perf_tests")
+    return project_key.endswith(
+        ("c_projects", "cpp_projects", "test_projects", "perf_tests")
     )
 
 
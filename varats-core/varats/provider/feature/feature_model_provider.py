@@ -1,5 +1,6 @@
 """Module for the :class:`FeatureProvider`."""
 import typing as tp
+from functools import lru_cache
 from pathlib import Path
 
 import benchbuild as bb
@@ -9,6 +10,27 @@ from benchbuild.source.base import target_prefix
 from varats.provider.provider import Provider
 
 
+@lru_cache(maxsize=None)
+def _fetch_feature_model_repository(prefix: str) -> Path:
+    """
+    Fetch the feature model repository once per target prefix.
+
+    Args:
+        prefix: BenchBuild's target prefix the repository is fetched into
+
+    Returns: the path to the local copy of the repository
+    """
+    fm_source = bb.source.Git(
+        remote="https://github.com/se-sic/ConfigurableSystems.git",
+        local="ConfigurableSystems",
+        refspec="origin/HEAD",
+        limit=1,
+    )
+    fm_source.fetch()
+
+    return Path(Path(prefix) / fm_source.local)
+
+
 class FeatureModelNotFound(FileNotFoundError):
     """Exception raised when the specified feature model could not be found."""
 
@@ -82,12 +104,4 @@ class FeatureModelProvider(Provider):
 
     @staticmethod
     def _get_feature_model_repository_path() -> Path:
-        fm_source = bb.source.Git(
-            remote="https://github.com/se-sic/ConfigurableSystems.git",
-            local="ConfigurableSystems",
-            refspec="origin/HEAD",
-            limit=1,
-        )
-        fm_source.fetch()
-
-        return Path(Path(target_prefix()) / fm_source.local)
+        return _fetch_feature_model_repository(target_prefix())
@@ -19,41 +19,52 @@ from varats.projects.perf_tests.feature_perf_cs_collection import (
 from varats.provider.provider import Provider
 from varats.utils.settings import vara_cfg
 
+_WorkloadArgsTy = tp.Tuple[tp.Union[str, Path], ...]
+
 
 class WorkloadProvider(Provider):
     """Provider for a list of arguments to execute binaries in a project
     with."""
 
-    WORKLOADS_BASE_DIR = Path(
-        str(vara_cfg()["experiment"]["workloads_base_location"])
-    )
-    WORKLOADS = {
-        f"{FeaturePerfCSCollection.NAME},SimpleSleepLoop": [
-            "--iterations", "100000", "--sleepns", "50000"
-        ],
-        f"{FeaturePerfCSCollection.NAME},SimpleBusyLoop": [
-            "--iterations", "100000", "--count_to", "100000"
-        ],
-        f"{Xz.NAME},xz": [
+    # Path arguments are relative to the configured workloads base location
+    # and are resolved when a provider is created.
+    WORKLOADS: tp.Dict[tp.Tuple[str, str], _WorkloadArgsTy] = {
+        (FeaturePerfCSCollection.NAME, "SimpleSleepLoop"):
+            ("--iterations", "100000", "--sleepns", "50000"),
+        (FeaturePerfCSCollection.NAME, "SimpleBusyLoop"):
+            ("--iterations", "100000", "--count_to", "100000"),
+        (Xz.NAME, "xz"): (
             "-k", "-f", "-9e", "--compress", "--threads=8", "--format=xz",
-            str(WORKLOADS_BASE_DIR / "compression/countries-land-1km.geo.json")
-        ],
-        f"{Brotli.NAME},brotli": [
+            Path("compression/countries-land-1km.geo.json")
+        ),
+        (Brotli.NAME, "brotli"): (
             "-f", "-o", "/tmp/brotli_compression_test.br",
-            str(WORKLOADS_BASE_DIR / "compression/countries-land-1km.geo.json")
-        ],
-        f"{Bzip2.NAME},bzip2": [
+            Path("compression/countries-land-1km.geo.json")
+        ),
+        (Bzip2.NAME, "bzip2"): (
             "--compress", "--best", "--verbose", "--keep", "--force",
-            str(WORKLOADS_BASE_DIR / "compression/countries-land-1m.geo.json")
-        ],
-        f"{Gzip.NAME},gzip": [
+            Path("compression/countries-land-1m.geo.json")
+        ),
+        (Gzip.NAME, "gzip"): (
             "--force", "--keep", "--name", "--recursive", "--verbose", "--best",
-            str(
-                WORKLOADS_BASE_DIR / "compression/countries-land-10km.geo.json"
-            )
-        ],
+            Path("compression/countries-land-10km.geo.json")
+        ),
     }
 
+    def __init__(self, project: tp.Type[Project]) -> None:
+        super().__init__(project)
+        workloads_base_dir = Path(
+            str(vara_cfg()["experiment"]["workloads_base_location"])
+        )
+        self.__workloads: tp.Dict[str, tp.Tuple[str, ...]] = {
+            binary_name: tuple(
+                str(workloads_base_dir / arg) if isinstance(arg, Path) else arg
+                for arg in args
+            )
+            for (project_name, binary_name), args in self.WORKLOADS.items()
+            if project_name == project.NAME
+        }
+
     @classmethod
     def create_provider_for_project(
         cls, project: tp.Type[Project]
@@ -81,8 +92,8 @@ class WorkloadProvider(Provider):
             "All usages should be covered by the project specific provider."
         )
 
-    def get_workload_for_binary(self,
-                                binary_name: str) -> tp.Optional[tp.List[str]]:
-        """Get a list of arguments to execute the given binary with."""
-        key = f"{self.project.NAME},{binary_name}"
-        return self.WORKLOADS.get(key, None)
+    def get_workload_for_binary(
+        self, binary_name: str
+    ) -> tp.Optional[tp.Tuple[str, ...]]:
+        """Get the arguments to execute the given binary with."""
+        return self.__workloads.get(binary_name, None)
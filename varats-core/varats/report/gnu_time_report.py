@@ -279,14 +279,15 @@ class TimeReportAggregate(
 
     @property
     def summary(self) -> str:
+        # convert every measurement list only once for mean and std
+        wall_clock_times = np.asarray(self.measurements_wall_clock_time)
+        ctx_switches = np.asarray(self.measurements_ctx_switches)
         return (
             f"num_reports = {len(self.reports())}\n"
             "mean (std) of wall clock time = "
-            f"{np.mean(self.measurements_wall_clock_time):.2f}"
-            f" ({np.std(self.measurements_wall_clock_time):.2f})\n"
+            f"{wall_clock_times.mean():.2f} ({wall_clock_times.std():.2f})\n"
             "mean (std) of context switches = "
-            f"{np.mean(self.measurements_ctx_switches):.2f}"
-            f" ({np.std(self.measurements_ctx_switches):.2f})\n"
+            f"{ctx_switches.mean():.2f} ({ctx_switches.std():.2f})\n"
         )
 
 
@@ -2,13 +2,16 @@
 minimal interface ``BaseReport`` to implement own reports."""
 
 import re
-import shutil
 import typing as tp
 import weakref
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
+from itertools import chain
 from pathlib import Path, PosixPath
 from tempfile import TemporaryDirectory
+from zipfile import ZipFile, ZipInfo
 
 from plumbum import colors
 from plumbum.colorlib.styles import Color
@@ -696,14 +699,39 @@ class KeyedReportAggregate(
         self.__tmpdir = TemporaryDirectory()  # pylint: disable=R1732
         self.__finalizer = weakref.finalize(self, self.__tmpdir.cleanup)
 
-        # Extract archive and parse reports.
-        if self.path.exists():
-            shutil.unpack_archive(self.path, self.__tmpdir.name)
-
         self.__default_key = default_key
         self.__reports: tp.Dict[KeyTy, tp.List[ReportTy]] = defaultdict(list)
-        for file in Path(self.__tmpdir.name).iterdir():
-            self.__reports[key_func(file)].append(report_type(file))
+
+        # Extract archive and parse reports.
+        if not self.path.exists():
+            return
+
+        with ZipFile(self.path) as archive, ThreadPoolExecutor() as io_pool:
+            report_members: tp.List[ZipInfo] = []
+            # top-level folders are reports, too, in the order of the archive
+            report_dirs: tp.Dict[str, None] = {}
+            for member in archive.infolist():
+                if member.is_dir() or "/" in member.filename:
+                    # Nested entries are extracted up front so that the
+                    # concurrent extraction never races on creating folders.
+                    archive.extract(member, self.__tmpdir.name)
+                    report_dirs[member.filename.split("/", 1)[0]] = None
+                else:
+                    report_members.append(member)
+
+            # Members are decompressed in background threads, which lets
+            # parsing the first reports overlap with extracting the others.
+            files = (
+                Path(file) for file in io_pool.map(
+                    partial(archive.extract, path=self.__tmpdir.name),
+                    report_members
+                )
+            )
+
+            for file in chain(
+                files, (Path(self.__tmpdir.name, name) for name in report_dirs)
+            ):
+                self.__reports[key_func(file)].append(report_type(file))
 
     def remove(self) -> None:
         self.__finalizer()
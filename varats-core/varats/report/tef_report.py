@@ -1,11 +1,13 @@
 """Report module to create and handle trace event format files, e.g., created
 with chrome tracing."""
 
-import json
+import sys
 import typing as tp
 from enum import Enum
 from pathlib import Path
 
+import ijson
+
 from varats.report.report import BaseReport, ReportAggregate
 
 
@@ -32,23 +34,39 @@ class TraceEventType(Enum):
     def parse_event_type(raw_event_type: str) -> 'TraceEventType':
         """Parses a raw string that represents a trace-format event type and
         converts it to the corresponding enum value."""
-        for trace_event_type in TraceEventType:
-            if trace_event_type.value == raw_event_type:
-                return trace_event_type
-
-        raise LookupError("Could not find correct trace event type")
+        try:
+            return _RAW_TO_TRACE_EVENT_TYPE[raw_event_type]
+        except KeyError as err:
+            raise LookupError(
+                "Could not find correct trace event type"
+            ) from err
 
     def __str__(self) -> str:
         return str(self.value)
 
 
+# Enums cannot hold a lookup table as class attribute, as it would become an
+# enum member, so the value to type mapping is kept next to the enum.
+_RAW_TO_TRACE_EVENT_TYPE: tp.Dict[str, TraceEventType] = {
+    trace_event_type.value: trace_event_type
+    for trace_event_type in TraceEventType
+}
+
+
 class TraceEvent():
     """Represents a trace event that was captured during the analysis of a
     target program."""
 
+    __slots__ = (
+        '__name', '__category', '__event_type', '__tracing_clock_timestamp',
+        '__pid', '__tid'
+    )
+
     def __init__(self, json_trace_event: tp.Dict[str, tp.Any]) -> None:
-        self.__name = str(json_trace_event["name"])
-        self.__category = str(json_trace_event["cat"])
+        # names and categories repeat across events, so share one string
+        # object per distinct value
+        self.__name = sys.intern(str(json_trace_event["name"]))
+        self.__category = sys.intern(str(json_trace_event["cat"]))
         self.__event_type = TraceEventType.parse_event_type(
             json_trace_event["ph"]
         )
@@ -95,27 +113,78 @@ class TraceEvent():
         return str(self)
 
 
-class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
-    """Report class to access trace event format files."""
-
-    def __init__(self, path: Path) -> None:
-        super().__init__(path)
+TraceEventFilterTy = tp.Callable[[tp.Dict[str, tp.Any]], bool]
 
-        with open(self.path, "r", encoding="utf-8") as json_tef_report:
-            data = json.load(json_tef_report)
 
-            self.__display_time_unit = str(data["displayTimeUnit"])
-            self.__trace_events = self._parse_trace_events(data["traceEvents"])
-            # Parsing stackFrames is currently not implemented
-            # x = data["stackFrames"]
+class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
+    """
+    Report class to access trace event format files.
+
+    The file is only parsed when its content is first accessed, so creating a
+    report is cheap. Reports whose file may disappear, e.g., because it was
+    extracted from an aggregate, need to be loaded with :func:`parse` first.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        event_filter: tp.Optional[TraceEventFilterTy] = None
+    ) -> None:
+        """
+        Args:
+            path: path to the trace event format file
+            event_filter: optional predicate on the raw json trace events;
+                          only events for which it returns True are parsed
+        """
+        super().__init__(path)
+        self.__event_filter = event_filter
+        self.__display_time_unit: tp.Optional[str] = None
+        self.__trace_events: tp.Optional[tp.List[TraceEvent]] = None
+        # Parsing stackFrames is currently not implemented
 
     @property
     def display_time_unit(self) -> str:
-        return self.__display_time_unit
+        if self.__display_time_unit is None:
+            self.parse()
+
+        return tp.cast(str, self.__display_time_unit)
 
     @property
     def trace_events(self) -> tp.List[TraceEvent]:
-        return self.__trace_events
+        if self.__trace_events is None:
+            self.parse()
+
+        return tp.cast(tp.List[TraceEvent], self.__trace_events)
+
+    def iter_trace_events(self) -> tp.Iterator[TraceEvent]:
+        """
+        Iterates over the trace events of the report.
+
+        If the trace events were not accessed before, they are streamed from
+        the file and not kept in memory, which is preferable for consumers
+        that need to look at each event only once.
+        """
+        if self.__trace_events is not None:
+            yield from self.__trace_events
+            return
+
+        with open(self.path, "rb") as json_tef_report:
+            for key, value in self._parse_json_report(
+                json_tef_report, self.__event_filter
+            ):
+                if key == "displayTimeUnit":
+                    self.__display_time_unit = value
+                else:
+                    yield value
+
+    def parse(self) -> None:
+        """Parses the whole report file in a single pass, filling all fields,
+        now instead of on first access."""
+        if self.__trace_events is None:
+            self.__trace_events = list(self.iter_trace_events())
+
+        if self.__display_time_unit is None:
+            raise KeyError("displayTimeUnit")
 
     @property
     def stack_frames(self) -> None:
@@ -124,10 +193,45 @@ class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
         )
 
     @staticmethod
-    def _parse_trace_events(
-        raw_event_list: tp.List[tp.Dict[str, tp.Any]]
-    ) -> tp.List[TraceEvent]:
-        return [TraceEvent(data_item) for data_item in raw_event_list]
+    def _parse_json_report(
+        json_tef_report: tp.BinaryIO,
+        event_filter: tp.Optional[TraceEventFilterTy] = None
+    ) -> tp.Iterator[tp.Tuple[str, tp.Any]]:
+        """
+        Parses a trace event format file in a single pass without loading the
+        whole json document.
+
+        Trace events are streamed from the file one at a time and directly
+        converted to :class:`TraceEvent` objects, other top-level fields are
+        picked up on the way.
+
+        Args:
+            json_tef_report: trace event format file opened in binary mode
+            event_filter: optional predicate on the raw json trace events;
+                          rejected events are dropped before conversion
+
+        Returns:
+            an iterator over ``("displayTimeUnit", unit)`` and
+            ``("traceEvents", event)`` pairs in file order
+        """
+        json_events = ijson.parse(json_tef_report, use_float=True)
+        for prefix, event, value in json_events:
+            if prefix == "displayTimeUnit":
+                yield prefix, str(value)
+            elif prefix == "traceEvents.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                for item_prefix, item_event, item_value in json_events:
+                    builder.event(item_event, item_value)
+                    if (
+                        item_prefix == "traceEvents.item" and
+                        item_event == "end_map"
+                    ):
+                        break
+
+                json_trace_event = builder.value
+                if event_filter is None or event_filter(json_trace_event):
+                    yield "traceEvents", TraceEvent(json_trace_event)
 
 
 class TEFReportAggregate(
@@ -140,3 +244,7 @@ class TEFReportAggregate(
 
     def __init__(self, path: Path) -> None:
         super().__init__(path, TEFReport)
+        # the extracted report files are removed together with the aggregate,
+        # so the reports cannot be parsed lazily
+        for report in self.reports():
+            report.parse()
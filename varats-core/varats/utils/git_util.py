@@ -5,11 +5,14 @@ import typing as tp
 from enum import Enum
 from itertools import chain
 from pathlib import Path
+from subprocess import PIPE
+from tempfile import TemporaryFile
 
 import pygit2
 from benchbuild.utils.cmd import git, grep
 from benchbuild.utils.revision_ranges import RevisionRange
 from plumbum import local, TF, RETCODE
+from plumbum.commands import ProcessExecutionError
 
 from varats.project.project_util import (
     get_local_project_gits,
@@ -213,8 +216,8 @@ def get_all_revisions_between(
     result.extend(
         reversed(
             git(
-                __get_git_path_arg(repo_folder), "log", "--pretty=%H",
-                "--ancestry-path", f"{c_start}..{c_end}"
+                __get_git_path_arg(repo_folder), "rev-list", "--ancestry-path",
+                f"{c_start}..{c_end}"
             ).strip().split()
         )
     )
@@ -365,6 +368,10 @@ class ChurnConfig():
 
     def __init__(self) -> None:
         self.__enabled_languages: tp.List[ChurnConfig.Language] = []
+        # sorted extensions of all enabled languages, kept in sync with
+        # __enabled_languages
+        self.__enabled_extensions: tp.Tuple[str, ...] = ()
+        self.__enabled_extensions_set: tp.FrozenSet[str] = frozenset()
 
     @staticmethod
     def create_default_config() -> 'ChurnConfig':
@@ -430,10 +437,7 @@ class ChurnConfig():
         Returns:
             True, if the extension is currently enabled in the config
         """
-        for lang in self.enabled_languages:
-            if file_extension in lang.value:
-                return True
-        return False
+        return file_extension in self.__enabled_extensions_set
 
     def is_language_enabled(self, language: 'ChurnConfig.Language') -> bool:
         """
@@ -450,10 +454,18 @@ class ChurnConfig():
     def enable_language(self, language: 'ChurnConfig.Language') -> None:
         """Enable `language` in the config."""
         self.__enabled_languages.append(language)
+        self.__update_enabled_extensions()
 
     def disable_language(self, language: 'ChurnConfig.Language') -> None:
         """Disable `language` in the config."""
         self.__enabled_languages.remove(language)
+        self.__update_enabled_extensions()
+
+    def __update_enabled_extensions(self) -> None:
+        self.__enabled_extensions_set = frozenset(
+            ext for lang in self.__enabled_languages for ext in lang.value
+        )
+        self.__enabled_extensions = tuple(sorted(self.__enabled_extensions_set))
 
     def get_extensions_repr(self,
                             prefix: str = "",
@@ -469,15 +481,7 @@ class ChurnConfig():
         Returns:
             list of modified string file extensions
         """
-        extensions_list: tp.List[str] = []
-
-        for ext in sorted({
-            ext for lang in self.enabled_languages for ext in lang.value
-        }):
-            ext = prefix + ext + suffix
-            extensions_list.append(ext)
-
-        return extensions_list
+        return [prefix + ext + suffix for ext in self.__enabled_extensions]
 
 
 class CommitRepoPair():
@@ -486,6 +490,18 @@ class CommitRepoPair():
     def __init__(self, commit_hash: FullCommitHash, repo_name: str) -> None:
         self.__commit_hash = commit_hash
         self.__repo_name = repo_name
+        # pairs are used heavily as dict/set keys, so compute the hash once
+        self.__hash = hash((commit_hash, repo_name))
+
+    def __getstate__(self) -> tp.Dict[str, tp.Any]:
+        # str hashes differ between processes, so never persist the hash
+        state = self.__dict__.copy()
+        del state["_CommitRepoPair__hash"]
+        return state
+
+    def __setstate__(self, state: tp.Dict[str, tp.Any]) -> None:
+        self.__dict__.update(state)
+        self.__hash = hash((self.__commit_hash, self.__repo_name))
 
     @property
     def commit_hash(self) -> FullCommitHash:
@@ -497,21 +513,21 @@ class CommitRepoPair():
 
     def __lt__(self, other: tp.Any) -> bool:
         if isinstance(other, CommitRepoPair):
-            if self.commit_hash.hash == other.commit_hash.hash:
-                return self.repository_name < other.repository_name
-            return self.commit_hash.hash < other.commit_hash.hash
+            if self.__commit_hash.hash == other.__commit_hash.hash:
+                return self.__repo_name < other.__repo_name
+            return self.__commit_hash.hash < other.__commit_hash.hash
         return False
 
     def __eq__(self, other: tp.Any) -> bool:
         if isinstance(other, CommitRepoPair):
             return (
-                self.commit_hash == other.commit_hash and
-                self.repository_name == other.repository_name
+                self.__commit_hash == other.__commit_hash and
+                self.__repo_name == other.__repo_name
             )
         return False
 
     def __hash__(self) -> int:
-        return hash((self.commit_hash, self.repository_name))
+        return self.__hash
 
     def __str__(self) -> str:
         return f"{self.repository_name}[{self.commit_hash}]"
@@ -605,11 +621,6 @@ def map_commits(
     ]
 
 
-GIT_LOG_MATCHER = re.compile(
-    r"\'(?P<hash>.*)\'\n?" + r"( (?P<files>\d*) files? changed)?" +
-    r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
-    r"(, (?P<deletions>\d*) deletions?\(-\))?"
-)
 GIT_DIFF_MATCHER = re.compile(
     r"( (?P<files>\d*) files? changed)?" +
     r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
@@ -664,25 +675,51 @@ def __calc_code_churn_range_impl(
         diff_base_params = diff_base_params + \
                            churn_config.get_extensions_repr('*.')
 
-    stdout = repo_git(diff_base_params)
     revs = repo_git(log_base_params).strip().split()
 
     # initialize with 0 as otherwise commits without changes would be
     # missing from the churn data
     for rev in revs:
         churn_values[FullCommitHash(rev)] = (0, 0, 0)
-    for match in GIT_LOG_MATCHER.finditer(stdout):
-        commit_hash = FullCommitHash(match.group('hash'))
-
-        def value_or_zero(match_result: tp.Any) -> int:
-            if match_result is not None:
-                return int(match_result)
-            return 0
 
-        files_changed = value_or_zero(match.group('files'))
-        insertions = value_or_zero(match.group('insertions'))
-        deletions = value_or_zero(match.group('deletions'))
-        churn_values[commit_hash] = (files_changed, insertions, deletions)
+    def value_or_zero(match_result: tp.Any) -> int:
+        if match_result is not None:
+            return int(match_result)
+        return 0
+
+    # Parse the log while git produces it instead of collecting the whole
+    # output first. Every commit is printed as "'<hash>'", followed by its
+    # shortstat line if it changed any of the selected files. Errors are
+    # written to a file, as an unread stderr pipe could block git.
+    with TemporaryFile("w+") as log_err, repo_git[diff_base_params].popen(
+        stdout=PIPE, stderr=log_err, universal_newlines=True
+    ) as log_proc:
+        commit_hash: tp.Optional[FullCommitHash] = None
+        for line in log_proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("'"):
+                commit_hash = FullCommitHash(line.strip("'"))
+                churn_values[commit_hash] = (0, 0, 0)
+                continue
+
+            if commit_hash is None or not line:
+                continue
+
+            match = GIT_DIFF_MATCHER.match(line)
+            if match:
+                files_changed = value_or_zero(match.group('files'))
+                insertions = value_or_zero(match.group('insertions'))
+                deletions = value_or_zero(match.group('deletions'))
+                churn_values[commit_hash] = (
+                    files_changed, insertions, deletions
+                )
+
+        log_proc.wait()
+        if log_proc.returncode != 0:
+            log_err.seek(0)
+            raise ProcessExecutionError(
+                log_proc.argv, log_proc.returncode, "", log_err.read()
+            )
 
     return churn_values
 
@@ -804,6 +841,61 @@ def calc_repo_code_churn(
     return calc_code_churn_range(repo_path, churn_config)
 
 
+ChurnLookupTy = tp.Callable[[CommitRepoPair], tp.Tuple[int, int, int]]
+
+
+def create_churn_lookup_helper(
+    project_name: str,
+    churn_config: tp.Optional[ChurnConfig] = None
+) -> ChurnLookupTy:
+    """
+    Creates a churn lookup function for the commits of project repositories.
+
+    The churn of all commits of a repository is calculated with a single git
+    call the first time a commit of that repository is looked up. Commits that
+    are not part of the repository's history up to HEAD fall back to a per
+    commit calculation.
+
+    Args:
+        project_name: name of the given benchbuild project
+        churn_config: churn config to customize churn generation
+
+    Returns:
+        a Callable that maps a commit hash and repository name to the churn
+        triple (files changed, insertions, deletions) of the commit
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    repos = get_local_project_gits(project_name)
+    repo_churn: tp.Dict[str, tp.Dict[FullCommitHash, tp.Tuple[int, int,
+                                                              int]]] = {}
+
+    def get_churn(crp: CommitRepoPair) -> tp.Tuple[int, int, int]:
+        """
+        Gets the churn of the commit from a given ``CommitRepoPair``.
+
+        Args:
+            crp: the ``CommitRepoPair`` for the commit to get the churn for
+
+        Returns:
+            the churn of the commit corresponding to the given CommitRepoPair
+        """
+        repo_path = Path(repos[crp.repository_name].path)
+        if crp.repository_name not in repo_churn:
+            repo_churn[crp.repository_name
+                      ] = calc_repo_code_churn(repo_path, churn_config)
+
+        churn = repo_churn[crp.repository_name].get(crp.commit_hash, None)
+        if churn is None:
+            churn = calc_commit_code_churn(
+                repo_path, crp.commit_hash, churn_config
+            )
+            repo_churn[crp.repository_name][crp.commit_hash] = churn
+
+        return churn
+
+    return get_churn
+
+
 def __print_calc_repo_code_churn(
     repo: pygit2.Repository,
     churn_config: tp.Optional[ChurnConfig] = None
@@ -868,17 +960,36 @@ def calc_repo_loc(repo: pygit2.Repository, rev_range: str) -> int:
 
     loc: int = 0
     with local.cwd(project_path):
-        files = git(
-            "ls-tree",
-            "-r",
-            "--name-only",
-            rev_range,
-        ).splitlines()
-
-        for file in files:
-            if file_pattern.match(file):
-                lines = git("show", f"{rev_range}:{file}").splitlines()
-                loc += len([line for line in lines if line])
+        # ls-tree lines have the form '<mode> <type> <object>\t<file>'
+        blob_ids = []
+        for tree_entry in git("ls-tree", "-r", rev_range).splitlines():
+            entry_info, file = tree_entry.split("\t", 1)
+            _, entry_type, object_id = entry_info.split()
+            if entry_type == "blob" and file_pattern.match(file):
+                blob_ids.append(object_id)
+
+        if not blob_ids:
+            return 0
+
+        # Stream all blobs through one git process instead of spawning a
+        # `git show` per file. Blobs are requested one at a time, so only a
+        # single blob needs to be kept in memory.
+        with git["cat-file",
+                 "--batch"].popen(stdin=PIPE, stdout=PIPE) as cat_file:
+            for blob_id in blob_ids:
+                cat_file.stdin.write(blob_id.encode() + b"\n")
+                cat_file.stdin.flush()
+
+                # every blob is printed as '<object> blob <size>\n<content>\n'
+                blob_size = int(cat_file.stdout.readline().split()[2])
+                content = cat_file.stdout.read(blob_size + 1)[:-1]
+                loc += len([
+                    line
+                    for line in content.decode(errors="ignore").splitlines()
+                    if line
+                ])
+
+            cat_file.stdin.close()
 
     return loc
 
@@ -896,6 +1007,8 @@ class RevisionBinaryMap(tp.Container[str]):
         self.__revision_specific_mappings: tp.Dict[RevisionRange,
                                                    ProjectBinaryWrapper] = {}
         self.__always_valid_mappings: tp.List[ProjectBinaryWrapper] = []
+        self.__revision_index: tp.Optional[tp.Dict[
+            ShortCommitHash, tp.List[ProjectBinaryWrapper]]] = None
 
     def specify_binary(
         self, location: str, binary_type: BinaryType, **kwargs: tp.Any
@@ -927,22 +1040,36 @@ class RevisionBinaryMap(tp.Container[str]):
 
         if validity_range:
             self.__revision_specific_mappings[validity_range] = wrapped_binary
+            self.__revision_index = None
         else:
             self.__always_valid_mappings.append(wrapped_binary)
 
+    def __get_revision_index(
+        self
+    ) -> tp.Dict[ShortCommitHash, tp.List[ProjectBinaryWrapper]]:
+        """Maps every revision covered by a validity range to the binaries that
+        are valid in it; built once on first lookup."""
+        if self.__revision_index is None:
+            revision_index: tp.Dict[ShortCommitHash,
+                                    tp.List[ProjectBinaryWrapper]] = {}
+            for validity_range, wrapped_binary \
+                    in self.__revision_specific_mappings.items():
+                for revision in get_all_revisions_between(
+                    validity_range.id_start, validity_range.id_end,
+                    ShortCommitHash, self.__repo_location
+                ):
+                    revision_index.setdefault(revision,
+                                              []).append(wrapped_binary)
+            self.__revision_index = revision_index
+
+        return self.__revision_index
+
     def __getitem__(self,
                     revision: CommitHash) -> tp.List[ProjectBinaryWrapper]:
         revision = revision.to_short_commit_hash()
-        revision_specific_binaries = []
-
-        for validity_range, wrapped_binary \
-                in self.__revision_specific_mappings.items():
-            if revision in get_all_revisions_between(
-                validity_range.id_start, validity_range.id_end, ShortCommitHash,
-                self.__repo_location
-            ):
-                revision_specific_binaries.append(wrapped_binary)
-
+        revision_specific_binaries = list(
+            self.__get_revision_index().get(revision, [])
+        )
         revision_specific_binaries.extend(self.__always_valid_mappings)
 
         return revision_specific_binaries
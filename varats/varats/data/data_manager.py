@@ -120,7 +120,10 @@ class DataManager():
     ) -> LoadableTy:
         # pylint: disable=invalid-name
         """Load a DataClass of type <DataClassTy> from a file."""
-        key = sha256_checksum(file_path)
+        # the same file can be loaded as different report types, e.g.,
+        # time report aggregates with or without workload grouping
+        key = f"{sha256_checksum(file_path)}-" \
+              f"{DataClassTy.__module__}.{DataClassTy.__qualname__}"
 
         self.loader_lock.acquire()  # pylint: disable=consider-using-with
         if key in self.file_map:
@@ -1,12 +1,13 @@
 """Implements the SZZUnleashed experiment."""
 
+import os
 import typing as tp
+from functools import lru_cache
 
 import yaml
 from benchbuild import Project, source
 from benchbuild.experiment import ProjectT
 from benchbuild.utils import actions
-from pygit2 import Commit
 
 from varats.base.version_header import VersionHeader
 from varats.data.reports.szz_report import (
@@ -18,11 +19,46 @@ from varats.experiment.experiment_util import (
     get_varats_result_folder,
     VersionExperiment,
 )
+from varats.project.project_util import get_local_project_git
 from varats.project.varats_project import VProject
+from varats.provider.bug.bug import PygitBug
 from varats.provider.bug.bug_provider import BugProvider
 from varats.report.report import FileStatusExtension as FSE
 from varats.report.report import ReportSpecification
 
+# the libyaml based dumper is faster but only available if PyYAML was built
+# with libyaml support
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+@lru_cache(maxsize=None)
+def _find_all_pygit_bugs(
+    project: tp.Type[Project],
+    head_commit: str  # pylint: disable=unused-argument
+) -> tp.FrozenSet[PygitBug]:
+    """
+    Find all bugs of a project, caching the result per repository state.
+
+    Args:
+        project: the project to search for bugs
+        head_commit: HEAD of the project's repository, only used as cache key
+
+    Returns:
+        a set of ``PygitBugs``
+    """
+    return BugProvider.get_provider_for_project(project).find_pygit_bugs()
+
+
+@lru_cache(maxsize=1)
+def _szz_report_header() -> str:
+    """Serialized version header document of SZZ reports."""
+    return yaml.dump(
+        VersionHeader.from_version_number("SZZReport", 1).get_dict(),
+        explicit_start=True,
+        explicit_end=True,
+        Dumper=_YAML_DUMPER
+    )
+
 
 class CreatePyDrillerSZZReport(actions.ProjectStep):  # type: ignore
     """
@@ -43,20 +79,19 @@ class CreatePyDrillerSZZReport(actions.ProjectStep):  # type: ignore
 
     def create_report(self) -> actions.StepResult:
         """Create a report from SZZ data."""
-        bug_provider = BugProvider.get_provider_for_project(self.project)
-        pygit_bugs = bug_provider.find_pygit_bugs()
+        head_commit = str(
+            get_local_project_git(self.project.name).head.target
+        )
+        pygit_bugs = _find_all_pygit_bugs(type(self.project), head_commit)
 
         varats_result_folder = get_varats_result_folder(self.project)
 
-        def commit_to_hash(commit: Commit) -> str:
-            return str(commit.id)
-
-        bugs: tp.Dict[str, tp.List[str]] = {}
-        # entries are lists of the form [<fix>, <introducing>]
-        for bug in pygit_bugs:
-            bugs[commit_to_hash(bug.fixing_commit)] = sorted([
-                commit_to_hash(commit) for commit in bug.introducing_commits
-            ])
+        # entries map a fixing commit to its sorted introducing commits
+        bugs: tp.Dict[str, tp.List[str]] = {
+            str(bug.fixing_commit.id):
+            sorted(str(commit.id) for commit in bug.introducing_commits)
+            for bug in pygit_bugs
+        }
         raw_szz_report = {
             "szz_tool": SZZTool.PYDRILLER_SZZ.tool_name,
             "bugs": bugs
@@ -71,16 +106,26 @@ class CreatePyDrillerSZZReport(actions.ProjectStep):  # type: ignore
             extension_type=FSE.SUCCESS
         )
 
-        with open(f"{varats_result_folder}/{result_file}", "w") as yaml_file:
-            yaml_file.write(
-                yaml.dump_all([
-                    VersionHeader.from_version_number("SZZReport",
-                                                      1).get_dict(),
-                    raw_szz_report
-                ],
-                              explicit_start=True,
-                              explicit_end=True)
-            )
+        # write to a temporary file first so that no partial reports are
+        # left behind if the step is interrupted
+        result_path = f"{varats_result_folder}/{result_file}"
+        tmp_result_path = result_path + ".tmp"
+        try:
+            with open(tmp_result_path, "w", buffering=1 << 20) as yaml_file:
+                yaml_file.write(_szz_report_header())
+                yaml_file.write(
+                    yaml.dump(
+                        raw_szz_report,
+                        explicit_start=True,
+                        explicit_end=True,
+                        Dumper=_YAML_DUMPER
+                    )
+                )
+            os.replace(tmp_result_path, result_path)
+        except BaseException:
+            if os.path.exists(tmp_result_path):
+                os.remove(tmp_result_path)
+            raise
 
         return actions.StepResult.OK
 
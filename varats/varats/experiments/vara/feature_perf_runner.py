@@ -2,6 +2,7 @@
 execution performance of each binary that is produced by a project."""
 import os
 import typing as tp
+from pathlib import Path
 
 from benchbuild import Project
 from benchbuild.extensions import compiler, run, time
@@ -25,6 +26,22 @@ from varats.report.report import ReportSpecification
 from varats.report.tef_report import TEFReport
 
 
+def _warm_page_cache(file_path: Path) -> None:
+    """
+    Read a workload file once so that the traced execution does not pay for
+    cold disk reads.
+
+    Args:
+        file_path: the file to load into the page cache
+    """
+    if not file_path.is_file():
+        return
+
+    with open(file_path, "rb", buffering=0) as workload_file:
+        while workload_file.read(1 << 20):
+            pass
+
+
 class ExecAndTraceBinary(actions.ProjectStep):  # type: ignore
     """Executes the specified binaries of the project, in specific
     configurations, against one or multiple workloads."""
@@ -69,6 +86,7 @@ class ExecAndTraceBinary(actions.ProjectStep):  # type: ignore
                 ):
 
                     workload = "/tmp/countries-land-1km.geo.json"
+                    _warm_page_cache(Path(workload))
 
                     # TODO: figure out how to handle workloads
                     binary("-k", workload)
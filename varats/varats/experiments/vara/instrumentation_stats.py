@@ -1,8 +1,10 @@
 """Module for experiment which measures statistics about the traced execution of
 a binary using VaRA's instrumented USDT probes."""
+import os
 import typing as tp
 from pathlib import Path
-from time import sleep
+from tempfile import TemporaryDirectory
+from time import monotonic, sleep
 
 from benchbuild import Project
 from benchbuild.extensions import compiler, run
@@ -31,6 +33,92 @@ from varats.report.report import ReportSpecification
 from varats.tools.research_tools.vara import VaRA
 
 
+_BPFTRACE_READY_SENTINEL = "VARATS_BPFTRACE_READY"
+
+
+def _add_bpftrace_ready_probe(bpftrace_script: Path, target_dir: Path) -> Path:
+    """
+    Create a copy of a bpftrace script that prints a readiness sentinel.
+
+    bpftrace fires ``BEGIN`` probes only after all other probes of the script
+    are attached, so the sentinel marks the point where tracing is active. The
+    probe is added after a leading shebang line, and the sentinel is removed
+    from the report again by :func:`_remove_bpftrace_ready_sentinel`.
+
+    Args:
+        bpftrace_script: the bpftrace script to extend
+        target_dir: directory to place the extended script in
+
+    Returns:
+        path to the extended script
+    """
+    script = bpftrace_script.read_text()
+    shebang = ""
+    if script.startswith("#!"):
+        shebang, _, script = script.partition("\n")
+        shebang += "\n"
+
+    ready_script = target_dir / bpftrace_script.name
+    ready_script.write_text(
+        shebang +
+        f'BEGIN {{ printf("{_BPFTRACE_READY_SENTINEL}\\n"); }}\n\n' + script
+    )
+    return ready_script
+
+
+def _remove_bpftrace_ready_sentinel(report_file: Path) -> None:
+    """
+    Remove the sentinel printed by the probe added with
+    :func:`_add_bpftrace_ready_probe` from a bpftrace report.
+
+    Args:
+        report_file: output file of the exited bpftrace process
+    """
+    if not report_file.exists():
+        return
+
+    # the report belongs to root, so it is replaced instead of rewritten
+    tmp_report_file = report_file.with_name(report_file.name + ".tmp")
+    with open(report_file, "r") as report, \
+            open(tmp_report_file, "w") as stripped_report:
+        for line in report:
+            if line.rstrip("\n") != _BPFTRACE_READY_SENTINEL:
+                stripped_report.write(line)
+    os.replace(tmp_report_file, report_file)
+
+
+def _wait_for_bpftrace_attach(
+    report_file: Path,
+    bpftrace_runner: Future,
+    timeout: float = 3.0,
+    poll_interval: float = 0.05
+) -> None:
+    """
+    Wait until bpftrace signals that its probes are attached.
+
+    Waits for the sentinel printed by the probe added with
+    :func:`_add_bpftrace_ready_probe`. If it does not show up within the
+    timeout, we continue anyway, which matches the previous fixed start-up
+    wait.
+
+    Args:
+        report_file: output file bpftrace was started with
+        bpftrace_runner: the running bpftrace process
+        timeout: maximum time to wait in seconds
+        poll_interval: time between two checks in seconds
+    """
+    deadline = monotonic() + timeout
+    while monotonic() < deadline and not bpftrace_runner.poll():
+        try:
+            with open(report_file, "r") as bpftrace_output:
+                if _BPFTRACE_READY_SENTINEL in bpftrace_output.read():
+                    return
+        except OSError:
+            pass  # bpftrace has not created the output file yet
+
+        sleep(poll_interval)
+
+
 class CaptureInstrumentationStats(actions.ProjectStep):  # type: ignore
     """Executes each binary and collects runtime statistics about
     instrumentation using VaRA's USDT probes and a bpftrace script."""
@@ -52,49 +140,57 @@ class CaptureInstrumentationStats(actions.ProjectStep):  # type: ignore
         """Capture instrumentation stats by running the binary with a workload
         and attaching the UsdtExecutionStats.bt."""
         vara_result_folder = get_varats_result_folder(self.project)
-        binary: ProjectBinaryWrapper
 
-        for binary in self.project.binaries:
-            if binary.type != BinaryType.EXECUTABLE:
-                continue
+        # Get workload provider to use.
+        # TODO (se-sic/VaRA#841): refactor to bb workloads if possible
+        workload_provider = WorkloadProvider.create_provider_for_project(
+            self.project
+        )
+        if not workload_provider:
+            print(
+                f"No workload provider for project={self.project.name}. " \
+                "Skipping."
+            )
+            return actions.StepResult.CAN_CONTINUE
+
+        # bpftrace script to attach to the binaries to trace them via USDT
+        vara_bpftrace_script = Path(
+            VaRA.install_location(),
+            "share/vara/perf_bpf_tracing/UsdtExecutionStats.bt"
+        )
 
-            # Get workload to use.
-            # TODO (se-sic/VaRA#841): refactor to bb workloads if possible
-            workload_provider = WorkloadProvider.create_provider_for_project(
-                self.project
+        binary: ProjectBinaryWrapper
+        with TemporaryDirectory() as tmp_dir, \
+                local.cwd(self.project.source_of_primary):
+            bpftrace_script = _add_bpftrace_ready_probe(
+                vara_bpftrace_script, Path(tmp_dir)
             )
-            if not workload_provider:
-                print(
-                    f"No workload provider for project={self.project.name}. " \
-                    "Skipping."
+
+            for binary in self.project.binaries:
+                if binary.type != BinaryType.EXECUTABLE:
+                    continue
+
+                workload = workload_provider.get_workload_for_binary(
+                    binary.name
                 )
-                return actions.StepResult.CAN_CONTINUE
-            workload = workload_provider.get_workload_for_binary(binary.name)
-            if workload is None:
-                print(
-                    f"No workload for project={self.project.name} " \
-                        f"binary={binary.name}. Skipping."
+                if workload is None:
+                    print(
+                        f"No workload for project={self.project.name} " \
+                            f"binary={binary.name}. Skipping."
+                    )
+                    continue
+
+                # Assemble Path for report.
+                report_file_name = create_new_success_result_filepath(
+                    self.__experiment_handle, VaraInstrumentationStatsReport,
+                    self.project, binary
                 )
-                continue
 
-            # Assemble Path for report.
-            report_file_name = create_new_success_result_filepath(
-                self.__experiment_handle, VaraInstrumentationStatsReport,
-                self.project, binary
-            )
+                report_file = Path(vara_result_folder, str(report_file_name))
 
-            report_file = Path(vara_result_folder, str(report_file_name))
-
-            # Execute binary.
-            with local.cwd(self.project.source_of_primary):
+                # Execute binary.
                 run_cmd = binary[workload]
 
-                # attach bpftrace to binary to allow tracing it via USDT
-                bpftrace_script = Path(
-                    VaRA.install_location(),
-                    "share/vara/perf_bpf_tracing/UsdtExecutionStats.bt"
-                )
-
                 # Assertion: Can be run without sudo password prompt. To
                 # guarentee this, add an entry to /etc/sudoers.
                 bpftrace_cmd = bpftrace["-o", report_file, bpftrace_script,
@@ -104,13 +200,14 @@ class CaptureInstrumentationStats(actions.ProjectStep):  # type: ignore
                 with local.as_root():
                     bpftrace_runner = bpftrace_cmd & BG
 
-                sleep(3)  # give bpftrace time to start up
+                _wait_for_bpftrace_attach(report_file, bpftrace_runner)
 
                 # Run.
                 run_cmd & FG  # pylint: disable=W0104
 
                 # Wait for bpftrace running in background to exit.
                 bpftrace_runner.wait()
+                _remove_bpftrace_ready_sentinel(report_file)
 
         return actions.StepResult.OK
 
@@ -3,6 +3,7 @@ import sys
 import typing as tp
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import benchbuild as bb
@@ -13,6 +14,11 @@ from PyQt5.QtCore import (
     Qt,
     QSortFilterProxyModel,
     QAbstractTableModel,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
 )
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox
@@ -31,20 +37,12 @@ from varats.project.project_util import (
     get_local_project_git_path,
     get_local_project_git,
     get_project_cls_by_name,
-    get_primary_project_source,
 )
 from varats.projects.discover_projects import initialize_projects
 from varats.revision.revisions import is_revision_blocked
 from varats.tools.research_tools.vara_manager import ProcessManager
 from varats.utils import settings
-from varats.utils.git_util import (
-    get_initial_commit,
-    get_all_revisions_between,
-    ShortCommitHash,
-    create_commit_lookup_helper,
-    FullCommitHash,
-    CommitRepoPair,
-)
+from varats.utils.git_util import ShortCommitHash, FullCommitHash
 from varats.utils.settings import vara_cfg
 
 
@@ -55,6 +53,47 @@ class GenerationStrategie(Enum):
     REVS_PER_YEAR = 2
 
 
+class RevisionLoaderSignals(QObject):
+    """Signals of the revision loader to communicate back to the GUI."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class RevisionLoader(QRunnable):
+    """Loads the revisions of a project in a background thread."""
+
+    def __init__(self, project_name: str) -> None:
+        super().__init__()
+        self.project_name = project_name
+        self.signals = RevisionLoaderSignals()
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Fetch the project repository and look up all its revisions."""
+        try:
+            # repository handles must not be shared between threads
+            repo = get_local_project_git(self.project_name)
+            repo.remotes[0].fetch()
+            head = str(repo.head.target)
+            # a single revision walk yields the commit objects directly,
+            # without listing hashes first and looking up every commit
+            # afterwards
+            commits = list(
+                repo.walk(
+                    repo.head.target,
+                    pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_REVERSE
+                )
+            )
+
+            cmap = get_commit_map(self.project_name)
+        except Exception as error:  # pylint: disable=broad-except
+            # exceptions do not propagate out of the thread pool
+            self.signals.error.emit((self.project_name, error))
+            return
+
+        self.signals.finished.emit((self.project_name, head, commits, cmap))
+
+
 class CsGenMainWindow(QMainWindow, Ui_MainWindow):
     """Main Application."""
 
@@ -69,6 +108,15 @@ class CsGenMainWindow(QMainWindow, Ui_MainWindow):
         self.revision_list.setModel(self.proxy_model)
         self.selected_project = None
         self.revision_list_project = None
+        self.loading_project = None
+        self.thread_pool = QThreadPool()
+        # loaded commit models per project, together with the HEAD they
+        # were loaded at
+        self.commit_models: tp.Dict[str, tp.Tuple[str,
+                                                  'CommitTableModel']] = {}
+        # repositories opened by the GUI thread; loaders open their own
+        self.project_repos: tp.Dict[str, pygit2.Repository] = {}
+        self.running_loaders: tp.Set[str] = set()
         self.update_project_list()
         self.project_list.clicked['QModelIndex'].connect(self.show_project_data)
         self.sampling_method.addItems([
@@ -128,12 +176,19 @@ class CsGenMainWindow(QMainWindow, Ui_MainWindow):
     def gen(self) -> None:
         """Generate the case study using the selected strategy, project and
         strategy specific arguments."""
+        if self.strategie_forms.currentIndex(
+        ) == GenerationStrategie.SELECT_REVISION.value and (
+            self.revision_list_project != self.selected_project
+        ):
+            # the revisions of the selected project are not shown yet
+            return
+
         cmap = get_commit_map(self.selected_project, refspec='HEAD')
         version = self.cs_version.value()
-        case_study = CaseStudy(self.revision_list_project, version)
+        case_study = CaseStudy(self.selected_project, version)
         paper_config = vara_cfg()["paper_config"]["current_config"].value
         path = Path(vara_cfg()["paper_config"]["folder"].value) / (
-            paper_config + f"/{self.revision_list_project}_{version}.case_study"
+            paper_config + f"/{self.selected_project}_{version}.case_study"
         )
 
         if self.strategie_forms.currentIndex(
@@ -183,32 +238,88 @@ class CsGenMainWindow(QMainWindow, Ui_MainWindow):
         self.strategie_forms.setCurrentIndex(
             GenerationStrategie.SELECT_REVISION.value
         )
-        if self.selected_project != self.revision_list_project:
+        if self.selected_project not in (
+            self.revision_list_project, self.loading_project
+        ):
+            if self.selected_project in self.running_loaders:
+                # show the result of the loader that is still running
+                self.loading_project = self.selected_project
+                self.clear_revision_list()
+                self.revision_details.setText("Loading Revisions")
+                self.revision_details.repaint()
+                return
+
+            head = str(self.project_repo(self.selected_project).head.target)
+            cached_head, commit_model = self.commit_models.get(
+                self.selected_project, (None, None)
+            )
+            if commit_model is not None and cached_head == head:
+                self.loading_project = None
+                self.proxy_model.setSourceModel(commit_model)
+                self.revision_list_project = self.selected_project
+                self.revision_details.clear()
+                self.revision_details.update()
+                return
+
+            self.clear_revision_list()
             self.revision_details.setText("Loading Revisions")
             self.revision_details.repaint()
-            get_local_project_git(self.selected_project).remotes[0].fetch()
-            git_path = get_local_project_git_path(self.selected_project)
-            initial_commit = get_initial_commit(git_path).hash
-            commits = get_all_revisions_between(
-                initial_commit, 'HEAD', FullCommitHash, git_path
-            )
-            commit_lookup_helper = create_commit_lookup_helper(
-                self.selected_project
-            )
-            project = get_project_cls_by_name(self.selected_project)
-            repo_name = get_primary_project_source(self.selected_project).local
-            commits = map(
-                lambda commit: CommitRepoPair(commit, repo_name), commits
-            )
+            self.loading_project = self.selected_project
+            self.running_loaders.add(self.selected_project)
+            loader = RevisionLoader(self.selected_project)
+            loader.signals.finished.connect(self.show_loaded_revisions)
+            loader.signals.error.connect(self.show_loading_error)
+            self.thread_pool.start(loader)
+
+    def clear_revision_list(self) -> None:
+        """Stop showing the revisions of the previously selected project."""
+        self.proxy_model.setSourceModel(None)
+        self.revision_list_project = None
 
-            cmap = get_commit_map(self.selected_project)
-            commit_model = CommitTableModel(
-                list(map(commit_lookup_helper, commits)), cmap, project
+    def project_repo(self, project_name: str) -> pygit2.Repository:
+        """Open the git repository of a project once and reuse it on the GUI
+        thread."""
+        if project_name not in self.project_repos:
+            self.project_repos[project_name] = get_local_project_git(
+                project_name
             )
-            self.proxy_model.setSourceModel(commit_model)
-            self.revision_list_project = self.selected_project
-            self.revision_details.clear()
-            self.revision_details.update()
+        return self.project_repos[project_name]
+
+    def show_loaded_revisions(
+        self, loaded_revisions: tp.Tuple[str, str, tp.List[pygit2.Commit],
+                                         CommitMap]
+    ) -> None:
+        """Show the revisions loaded by a :class:`RevisionLoader` unless
+        another project was selected in the meantime."""
+        project_name, head, commits, cmap = loaded_revisions
+        self.running_loaders.discard(project_name)
+        project = get_project_cls_by_name(project_name)
+        commit_model = CommitTableModel(commits, cmap, project)
+        self.commit_models[project_name] = (head, commit_model)
+        if project_name != self.loading_project:
+            return
+
+        self.loading_project = None
+        self.proxy_model.setSourceModel(commit_model)
+        self.revision_list_project = project_name
+        self.revision_details.clear()
+        self.revision_details.update()
+
+    def show_loading_error(
+        self, loading_error: tp.Tuple[str, Exception]
+    ) -> None:
+        """Report a :class:`RevisionLoader` that failed, so that loading the
+        revisions of the project can be retried."""
+        project_name, error = loading_error
+        self.running_loaders.discard(project_name)
+        if project_name != self.loading_project:
+            return
+
+        self.loading_project = None
+        self.revision_details.setText(
+            f"Could not load revisions of {project_name}:\n{error}"
+        )
+        self.revision_details.update()
 
     def show_revision_data(self, index: QModelIndex) -> None:
         """Update the revision data field."""
@@ -242,6 +353,12 @@ class CommitTableFilterModel(QSortFilterProxyModel):
                    .__contains__(self.filter_string.lower())
 
 
+@lru_cache(maxsize=None)
+def _author_timezone(offset: int) -> timezone:
+    """Timezone for a commit offset in minutes; repos only use a few."""
+    return timezone(timedelta(minutes=offset))
+
+
 class CommitTableModel(QAbstractTableModel):
     """Date Model for the revision Table."""
     header_labels = ["Commit", "Author", "Date", "Time Id"]
@@ -270,12 +387,14 @@ class CommitTableModel(QAbstractTableModel):
 
     def __split_commit_data(self, commit: pygit2.Commit, column: int) -> tp.Any:
         if column == 0:
-            return ShortCommitHash(commit.hex).hash
+            return commit.hex[:ShortCommitHash.hash_length()]
         if column == 1:
             return commit.author.name
         if column == 2:
-            tzinfo = timezone(timedelta(minutes=commit.author.offset))
-            date = datetime.fromtimestamp(float(commit.author.time), tzinfo)
+            author = commit.author
+            date = datetime.fromtimestamp(
+                float(author.time), _author_timezone(author.offset)
+            )
             return QDateTime(date)
         if column == 3:
             return self._cmap.short_time_id(ShortCommitHash(commit.hex))
@@ -21,6 +21,10 @@ from varats.data.reports.szz_report import (
     PyDrillerSZZReport,
 )
 from varats.mapping.commit_map import CommitMap
+from varats.report.gnu_time_report import (
+    TimeReportAggregate,
+    WLTimeReportAggregate,
+)
 
 
 def load_commit_report(file_path: Path) -> CommitReport:
@@ -127,3 +131,23 @@ def load_feature_analysis_report(file_path: Path) -> \
         file_path (Path): Full path to the file
     """
     return VDM.load_data_class_sync(file_path, FeatureAnalysisReport)
+
+
+def load_time_report_aggregate(file_path: Path) -> TimeReportAggregate:
+    """
+    Load a TimeReportAggregate from a file.
+
+    Attributes:
+        file_path (Path): Full path to the file
+    """
+    return VDM.load_data_class_sync(file_path, TimeReportAggregate)
+
+
+def load_wl_time_report_aggregate(file_path: Path) -> WLTimeReportAggregate:
+    """
+    Load a WLTimeReportAggregate from a file.
+
+    Attributes:
+        file_path (Path): Full path to the file
+    """
+    return VDM.load_data_class_sync(file_path, WLTimeReportAggregate)
@@ -372,6 +372,7 @@ class PlotGenerator(abc.ABC):
     def __init__(self, plot_config: PlotConfig, **plot_kwargs: tp.Any):
         self.__plot_config = plot_config
         self.__plot_kwargs = plot_kwargs
+        self.__plots: tp.Optional[tp.List['varats.plot.plot.Plot']] = None
 
     @classmethod
     def __init_subclass__(
@@ -439,6 +440,20 @@ class PlotGenerator(abc.ABC):
     def generate(self) -> tp.List['varats.plot.plot.Plot']:
         """Create the plot instance(s) that should be generated."""
 
+    @final
+    def generated_plots(self) -> tp.List['varats.plot.plot.Plot']:
+        """
+        Plot instance(s) of this generator.
+
+        :func:`generate` is only called once; later calls reuse its result.
+
+        Returns:
+            the plot instance(s) that should be generated
+        """
+        if self.__plots is None:
+            self.__plots = self.generate()
+        return self.__plots
+
     @final
     def __call__(
         self,
@@ -456,7 +471,7 @@ class PlotGenerator(abc.ABC):
         if not plot_dir.exists():
             plot_dir.mkdir(parents=True)
 
-        plots = self.generate()
+        plots = self.generated_plots()
 
         if len(plots) > 1 and common_options.view:
             common_options.view = cli_yn_choice(
@@ -516,6 +531,7 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         self.__common_options.plot_dir = output_dir
         self.__plot_config = plot_config
         self.__plot_kwargs = kwargs
+        self.__generator_instance: tp.Optional[PlotGenerator] = None
 
     @property
     def plot_generator_type(self) -> str:
@@ -614,6 +630,13 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
             generator.plot_config, **generator.plot_kwargs
         )
 
+    def __get_generator_instance(self) -> PlotGenerator:
+        if self.__generator_instance is None:
+            self.__generator_instance = self.plot_generator_class(
+                self.plot_config, **self.__plot_kwargs
+            )
+        return self.__generator_instance
+
     def generate_artefact(
         self, progress: tp.Optional["Progress"] = None
     ) -> None:
@@ -622,10 +645,7 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         if progress:
             task_id = progress.add_task(description=f"Building {self.name}")
 
-        generator_instance = self.plot_generator_class(
-            self.plot_config, **self.__plot_kwargs
-        )
-        generator_instance(self.common_options, progress, task_id)
+        self.__get_generator_instance()(self.common_options, progress, task_id)
 
     def get_artefact_file_infos(self) -> tp.List[ArtefactFileInfo]:
         """
@@ -634,12 +654,9 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         Returns:
             a list of file info objects
         """
-        generator_instance = self.plot_generator_class(
-            self.plot_config, **self.__plot_kwargs
-        )
         return [
             ArtefactFileInfo(
                 plot.plot_file_name(self.common_options.file_type),
                 plot.plot_kwargs.get("case_study", None)
-            ) for plot in generator_instance.generate()
+            ) for plot in self.__get_generator_instance().generated_plots()
         ]
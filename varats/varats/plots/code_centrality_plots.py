@@ -1,7 +1,6 @@
 """Module for code centrality plots."""
 import logging
 import typing as tp
-from pathlib import Path
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -18,13 +17,12 @@ from varats.paper_mgmt.case_study import (
 )
 from varats.plot.plot import Plot, PlotDataEmpty
 from varats.plot.plots import PlotGenerator
-from varats.project.project_util import get_local_project_gits
 from varats.ts_utils.click_param_types import REQUIRE_CASE_STUDY
 from varats.utils.git_util import (
     CommitRepoPair,
     create_commit_lookup_helper,
     ChurnConfig,
-    calc_commit_code_churn,
+    create_churn_lookup_helper,
     UNCOMMITTED_COMMIT_HASH,
     FullCommitHash,
 )
@@ -58,7 +56,7 @@ class CodeCentralityPlot(Plot, plot_name='code_centrality'):
             project_name, revision, BlameReportExperiment
         ).commit_interaction_graph()
         commit_lookup = create_commit_lookup_helper(project_name)
-        repo_lookup = get_local_project_gits(project_name)
+        churn_lookup = create_churn_lookup_helper(project_name, churn_config)
 
         def filter_nodes(node: CommitRepoPair) -> bool:
             if node.commit_hash == UNCOMMITTED_COMMIT_HASH:
@@ -71,10 +69,7 @@ class CodeCentralityPlot(Plot, plot_name='code_centrality'):
             commit = node_attrs["commit"]
             if not filter_nodes(commit):
                 continue
-            _, insertions, _ = calc_commit_code_churn(
-                Path(repo_lookup[commit.repository_name].path),
-                commit.commit_hash, churn_config
-            )
+            _, insertions, _ = churn_lookup(commit)
             if insertions == 0:
                 LOG.warning(f"Churn for commit {commit} is 0.")
                 insertions = 1
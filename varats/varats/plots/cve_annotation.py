@@ -1,6 +1,7 @@
 """Annotate CVE/CWE data to a plot."""
 import typing as tp
 
+import numpy as np
 from benchbuild.project import Project
 from matplotlib import axes
 
@@ -29,24 +30,32 @@ def draw_cves(
     """
     cmap = get_commit_map(project.NAME)
     revision_time_ids = [cmap.time_id(rev) for rev in revisions]
+    time_id_indices = {
+        time_id: index for index, time_id in enumerate(revision_time_ids)
+    }
+    if not revision_time_ids:
+        return
+    sorted_time_ids = np.sort(revision_time_ids)
+    min_time_id, max_time_id = sorted_time_ids[0], sorted_time_ids[-1]
+
+    transform = axis.get_xaxis_transform()
+    cve_indices: tp.List[float] = []
 
     cve_provider = CVEProvider.get_provider_for_project(project)
     for revision, cves in cve_provider.get_revision_cve_tuples():
         cve_time_id = cmap.time_id(revision)
-        if cve_time_id in revision_time_ids:
-            index = float(revisions.index(revision))
+        if not min_time_id <= cve_time_id <= max_time_id:
+            # revision outside of the plotted range
+            continue
+
+        if cve_time_id in time_id_indices:
+            index = float(time_id_indices[cve_time_id])
         else:
             # revision not in sample; draw line between closest samples
-            index = len([x for x in revision_time_ids if x < cve_time_id]) - 0.5
+            index = float(np.searchsorted(sorted_time_ids, cve_time_id)) - 0.5
 
-        transform = axis.get_xaxis_transform()
         for cve in cves:
-            axis.axvline(
-                index,
-                label=cve.cve_id,
-                linewidth=cve_line_width,
-                color=cve_color
-            )
+            cve_indices.append(index)
             axis.text(
                 index + 0.1,
                 0,
@@ -57,3 +66,14 @@ def draw_cves(
                 color=cve_color,
                 va=vertical_alignment
             )
+
+    # draw all CVE lines as a single line collection
+    if cve_indices:
+        axis.vlines(
+            cve_indices,
+            0,
+            1,
+            transform=transform,
+            linewidth=cve_line_width,
+            color=cve_color
+        )
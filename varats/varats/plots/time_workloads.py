@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 
+from varats.jupyterhelper.file import load_wl_time_report_aggregate
 from varats.paper_mgmt.case_study import get_case_study_file_name_filter
 from varats.paper_mgmt.paper_config import get_loaded_paper_config
 from varats.plot.plot import Plot
@@ -22,14 +23,16 @@ class TimedWorkloadPlot(Plot, plot_name="timed_workload"):
     def plot(self, view_mode: bool) -> None:
         case_studies = get_loaded_paper_config().get_all_case_studies()
 
-        df = pd.DataFrame()
-
         if len(self.plot_kwargs["experiment_type"]) > 1:
             print(
                 "Plot can currently only handle a single experiment, "
                 "ignoring everything else."
             )
 
+        unique_references: tp.List[str] = []
+        workloads: tp.List[str] = []
+        wall_clock_times: tp.List[float] = []
+
         for case_study in case_studies:
             project_name = case_study.project_name
 
@@ -40,29 +43,47 @@ class TimedWorkloadPlot(Plot, plot_name="timed_workload"):
             )
 
             for report_filepath in report_files:
-                agg_time_report = WLTimeReportAggregate(
+                agg_time_report = load_wl_time_report_aggregate(
                     report_filepath.full_path()
                 )
                 report_file = agg_time_report.filename
+                revision = str(report_file.commit_hash)
+                unique_reference = (
+                    f"{project_name}-"
+                    f"{report_file.binary_name}"
+                    f"-{revision}"
+                )
 
                 for workload_name in agg_time_report.workload_names():
-                    for wall_clock_time in \
-                            agg_time_report.measurements_wall_clock_time(
-                        workload_name
-                    ):
-                        unique_reference = (
-                            f"{project_name}-"
-                            f"{report_file.binary_name}"
-                            f"-{str(report_file.commit_hash)}"
+                    measurements = \
+                        agg_time_report.measurements_wall_clock_time(
+                            workload_name
                         )
-                        new_row = {
-                            "Project-Binary-Revision": unique_reference,
-                            "Workload": workload_name,
-                            "Revision": str(report_file.commit_hash),
-                            "Mean wall time (msecs)": wall_clock_time * 1000,
-                        }
-
-                        df = df.append(new_row, ignore_index=True)
+                    num_measurements = len(measurements)
+                    unique_references.extend(
+                        [unique_reference] * num_measurements
+                    )
+                    workloads.extend([workload_name] * num_measurements)
+                    wall_clock_times.extend(
+                        wall_clock_time * 1000
+                        for wall_clock_time in measurements
+                    )
+
+        # categorical columns store each label once; categories are kept in
+        # order of appearance so seaborn orders boxes as before
+        df = pd.DataFrame({
+            "Project-Binary-Revision":
+                pd.Categorical(
+                    unique_references,
+                    categories=list(dict.fromkeys(unique_references))
+                ),
+            "Workload":
+                pd.Categorical(
+                    workloads, categories=list(dict.fromkeys(workloads))
+                ),
+            "Mean wall time (msecs)":
+                wall_clock_times,
+        })
 
         fig, ax = plt.subplots()
         fig.set_size_inches(11.7, 8.27)
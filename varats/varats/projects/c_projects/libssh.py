@@ -1,5 +1,8 @@
 """Project file for libssh."""
+import shutil
 import typing as tp
+from functools import lru_cache
+from pathlib import Path
 
 import benchbuild as bb
 from benchbuild.utils.cmd import make, cmake, mkdir
@@ -29,6 +32,23 @@ from varats.utils.git_util import (
 from varats.utils.settings import bb_cfg
 
 
+@lru_cache(maxsize=None)
+def _revisions_between(repo_folder: Path, c_start: str,
+                       c_end: str) -> tp.FrozenSet[ShortCommitHash]:
+    """
+    Revisions of a libssh repository between two commits, so that repeated
+    builds neither walk the history again nor scan a list.
+
+    Both ends need to be commit hashes, as the result of a range ending at a
+    branch would change with the branch.
+    """
+    return frozenset(
+        get_all_revisions_between(
+            c_start, c_end, ShortCommitHash, repo_folder
+        )
+    )
+
+
 class Libssh(VProject):
     """
     SSH library.
@@ -59,7 +79,7 @@ class Libssh(VProject):
 
     CONTAINER = get_base_image(
         ImageBase.DEBIAN_10
-    ).run('apt', 'install', '-y', 'libssl-dev', 'cmake')
+    ).run('apt', 'install', '-y', 'libssl-dev', 'cmake', 'ninja-build')
 
     @staticmethod
     def binaries_for_revision(
@@ -102,11 +122,16 @@ class Libssh(VProject):
 
         compiler = bb.compiler.cc(self)
         mkdir("-p", libssh_source / "build")
+        # ninja is installed in the container, native builds fall back to make
+        if shutil.which("ninja"):
+            generator, build_tool = "Ninja", local["ninja"]
+        else:
+            generator, build_tool = "Unix Makefiles", make
         with local.cwd(libssh_source / "build"):
             with local.env(CC=str(compiler)):
-                bb.watch(cmake)("-G", "Unix Makefiles", "..")
+                bb.watch(cmake)("-G", generator, "..")
 
-            bb.watch(make)("-j", get_number_of_jobs(bb_cfg()))
+            bb.watch(build_tool)("-j", get_number_of_jobs(bb_cfg()))
 
         with local.cwd(libssh_source):
             verify_binaries(self)
@@ -114,15 +139,13 @@ class Libssh(VProject):
     def __compile_make(self) -> None:
         libssh_source = local.path(self.source_of(self.primary_source))
         libssh_version = ShortCommitHash(self.version_of_primary)
-        autoconf_revisions = get_all_revisions_between(
-            "5e02c25291d594e01a910fce097a3fc5084fd68f",
-            "21e639cc3fd54eb3d59568744c9627beb26e07ed", ShortCommitHash,
-            libssh_source
+        autoconf_revisions = _revisions_between(
+            Path(libssh_source), "5e02c25291d594e01a910fce097a3fc5084fd68f",
+            "21e639cc3fd54eb3d59568744c9627beb26e07ed"
         )
-        autogen_revisions = get_all_revisions_between(
-            "ca32b0aa146b31d7772f27d16098845e615432aa",
-            "ee54acb417c5589a8dc9dab0676f34b3d40a182b", ShortCommitHash,
-            libssh_source
+        autogen_revisions = _revisions_between(
+            Path(libssh_source), "ca32b0aa146b31d7772f27d16098845e615432aa",
+            "ee54acb417c5589a8dc9dab0676f34b3d40a182b"
         )
         compiler = bb.compiler.cc(self)
         with local.cwd(libssh_source):
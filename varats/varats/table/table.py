@@ -36,6 +36,7 @@ class Table:
     def __init__(self, table_config: TableConfig, **kwargs: tp.Any) -> None:
         self.__table_config = table_config
         self.__saved_extra_args = kwargs
+        self.__file_name_stem: tp.Optional[str] = None
 
     @classmethod
     def __init_subclass__(
@@ -145,20 +146,29 @@ class Table:
         >>> p.table_file_name(TableFormat.LATEX_BOOKTABS)
         'baz_42_Table.tex'
         """
-        table_ident = ''
-        if 'case_study' in self.table_kwargs:
-            case_study: 'CaseStudy' = self.table_kwargs['case_study']
-            table_ident = f"{case_study.project_name}_{case_study.version}_"
-        elif 'project' in self.table_kwargs:
-            table_ident = f"{self.table_kwargs['project']}_"
-
-        sep_stages = ''
-        if self.supports_stage_separation(
-        ) and self.table_kwargs.get('sep_stages', None):
-            sep_stages = 'S'
-
         filetype = self.format_filetypes.get(table_format, "txt")
-        return f"{table_ident}{self.name}{sep_stages}.{filetype}"
+        return f"{self.__table_file_name_stem()}.{filetype}"
+
+    def __table_file_name_stem(self) -> str:
+        """File name of this table without the format dependent filetype."""
+        if self.__file_name_stem is None:
+            table_ident = ''
+            if 'case_study' in self.table_kwargs:
+                case_study: 'CaseStudy' = self.table_kwargs['case_study']
+                table_ident = (
+                    f"{case_study.project_name}_{case_study.version}_"
+                )
+            elif 'project' in self.table_kwargs:
+                table_ident = f"{self.table_kwargs['project']}_"
+
+            sep_stages = ''
+            if self.supports_stage_separation(
+            ) and self.table_kwargs.get('sep_stages', None):
+                sep_stages = 'S'
+
+            self.__file_name_stem = f"{table_ident}{self.name}{sep_stages}"
+
+        return self.__file_name_stem
 
     def show(self) -> None:
         """Show the current table in console."""
@@ -347,6 +347,7 @@ class TableGenerator(abc.ABC):
     def __init__(self, table_config: TableConfig, **table_kwargs: tp.Any):
         self.__table_config = table_config
         self.__table_kwargs = table_kwargs
+        self.__tables: tp.Optional[tp.List['varats.table.table.Table']] = None
 
     @classmethod
     def __init_subclass__(
@@ -413,6 +414,20 @@ class TableGenerator(abc.ABC):
     def generate(self) -> tp.List['varats.table.table.Table']:
         """Create the table instance(s) that should be generated."""
 
+    @final
+    def generated_tables(self) -> tp.List['varats.table.table.Table']:
+        """
+        Table instance(s) of this generator.
+
+        :func:`generate` is only called once; later calls reuse its result.
+
+        Returns:
+            the table instance(s) that should be generated
+        """
+        if self.__tables is None:
+            self.__tables = self.generate()
+        return self.__tables
+
     @final
     def __call__(
         self,
@@ -430,7 +445,7 @@ class TableGenerator(abc.ABC):
         if not table_dir.exists():
             table_dir.mkdir(parents=True)
 
-        tables = self.generate()
+        tables = self.generated_tables()
 
         if len(tables) > 1 and common_options.view:
             common_options.view = cli_yn_choice(
@@ -493,6 +508,7 @@ class TableArtefact(Artefact, artefact_type="table", artefact_type_version=2):
         self.__common_options.table_dir = output_dir
         self.__table_config = table_config
         self.__table_kwargs = kwargs
+        self.__generator_instance: tp.Optional[TableGenerator] = None
 
     @property
     def table_generator_type(self) -> str:
@@ -593,6 +609,13 @@ class TableArtefact(Artefact, artefact_type="table", artefact_type_version=2):
             generator.table_config, **generator.table_kwargs
         )
 
+    def __get_generator_instance(self) -> TableGenerator:
+        if self.__generator_instance is None:
+            self.__generator_instance = self.table_generator_class(
+                self.table_config, **self.__table_kwargs
+            )
+        return self.__generator_instance
+
     def generate_artefact(
         self, progress: tp.Optional["Progress"] = None
     ) -> None:
@@ -601,10 +624,7 @@ class TableArtefact(Artefact, artefact_type="table", artefact_type_version=2):
         if progress:
             task_id = progress.add_task(description=f"Building {self.name}")
 
-        generator_instance = self.table_generator_class(
-            self.table_config, **self.__table_kwargs
-        )
-        generator_instance(self.common_options, progress, task_id)
+        self.__get_generator_instance()(self.common_options, progress, task_id)
 
     def get_artefact_file_infos(self) -> tp.List[ArtefactFileInfo]:
         """
@@ -613,12 +633,9 @@ class TableArtefact(Artefact, artefact_type="table", artefact_type_version=2):
         Returns:
             a list of file info objects
         """
-        generator_instance = self.table_generator_class(
-            self.table_config, **self.__table_kwargs
-        )
         return [
             ArtefactFileInfo(
                 table.table_file_name(self.common_options.table_format),
                 table.table_kwargs.get("case_study", None)
-            ) for table in generator_instance.generate()
+            ) for table in self.__get_generator_instance().generated_tables()
         ]
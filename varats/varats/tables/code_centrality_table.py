@@ -1,7 +1,6 @@
 """Module for code centrality tables."""
 import logging
 import typing as tp
-from pathlib import Path
 
 import pandas as pd
 
@@ -16,7 +15,6 @@ from varats.paper.case_study import CaseStudy
 from varats.paper_mgmt.case_study import (
     newest_processed_revision_for_case_study,
 )
-from varats.project.project_util import get_local_project_gits
 from varats.table.table import Table, TableDataEmpty
 from varats.table.table_utils import dataframe_to_table
 from varats.table.tables import TableFormat, TableGenerator
@@ -24,7 +22,7 @@ from varats.ts_utils.cli_util import CLIOptionTy, make_cli_option
 from varats.ts_utils.click_param_types import REQUIRE_MULTI_CASE_STUDY
 from varats.utils.git_util import (
     ChurnConfig,
-    calc_commit_code_churn,
+    create_churn_lookup_helper,
     create_commit_lookup_helper,
     CommitRepoPair,
     UNCOMMITTED_COMMIT_HASH,
@@ -43,7 +41,7 @@ def _collect_cig_node_data(
         project_name, revision, experiment_type
     ).commit_interaction_graph()
     commit_lookup = create_commit_lookup_helper(project_name)
-    repo_lookup = get_local_project_gits(project_name)
+    churn_lookup = create_churn_lookup_helper(project_name, churn_config)
 
     def filter_nodes(node: CommitRepoPair) -> bool:
         if node.commit_hash == UNCOMMITTED_COMMIT_HASH:
@@ -56,10 +54,7 @@ def _collect_cig_node_data(
         commit = node_attrs["commit"]
         if not filter_nodes(commit):
             continue
-        _, insertions, _ = calc_commit_code_churn(
-            Path(repo_lookup[commit.repository_name].path), commit.commit_hash,
-            churn_config
-        )
+        _, insertions, _ = churn_lookup(commit)
         if insertions == 0:
             LOG.warning(f"Churn for commit {commit} is 0.")
             insertions = 1
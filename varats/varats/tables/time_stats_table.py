@@ -4,6 +4,7 @@ import typing as tp
 import numpy as np
 import pandas as pd
 
+from varats.jupyterhelper.file import load_time_report_aggregate
 from varats.paper_mgmt.case_study import get_case_study_file_name_filter
 from varats.paper_mgmt.paper_config import get_loaded_paper_config
 from varats.report.gnu_time_report import TimeReportAggregate
@@ -21,7 +22,7 @@ class TimeStatsTable(Table, table_name="time_stats"):
     def tabulate(self, table_format: TableFormat, wrap_table: bool) -> str:
         case_studies = get_loaded_paper_config().get_all_case_studies()
 
-        df = pd.DataFrame()
+        rows: tp.List[tp.Dict[str, tp.Any]] = []
 
         for case_study in case_studies:
             project_name = case_study.project_name
@@ -33,19 +34,24 @@ class TimeStatsTable(Table, table_name="time_stats"):
                 )
 
                 report_file = report_files[0]
-                time_aggregated = TimeReportAggregate(report_file)
+                time_aggregated = load_time_report_aggregate(
+                    report_file.full_path()
+                )
                 report_name = time_aggregated.filename
 
-                mean_runtime = np.mean(
+                # convert every measurement list only once for mean and std
+                wall_clock_times = np.asarray(
                     time_aggregated.measurements_wall_clock_time
                 )
-                std_runtime = np.std(
-                    time_aggregated.measurements_wall_clock_time
+                ctx_switches = np.asarray(
+                    time_aggregated.measurements_ctx_switches
                 )
-                mean_ctx = np.mean(time_aggregated.measurements_ctx_switches)
-                std_ctx = np.std(time_aggregated.measurements_ctx_switches)
+                mean_runtime = wall_clock_times.mean()
+                std_runtime = wall_clock_times.std()
+                mean_ctx = ctx_switches.mean()
+                std_ctx = ctx_switches.std()
 
-                new_row = {
+                rows.append({
                     "Binary":
                         report_name.binary_name,
                     "Experiment":
@@ -54,10 +60,15 @@ class TimeStatsTable(Table, table_name="time_stats"):
                         f"{mean_runtime:.2f} ({std_runtime:.2f})",
                     "Ctx-Switches Mean (Std)":
                         f"{mean_ctx:.2f} ({std_ctx:.2f})"
-                }
-
-                df = df.append(new_row, ignore_index=True)
-
+                })
+
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "Binary", "Experiment", "Runtime Mean (Std)",
+                "Ctx-Switches Mean (Std)"
+            ]
+        )
         df.sort_values(["Binary", "Experiment"], inplace=True)
         df.set_index(
             ["Binary", "Experiment"],
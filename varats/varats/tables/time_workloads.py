@@ -4,6 +4,7 @@ import typing as tp
 import numpy as np
 import pandas as pd
 
+from varats.jupyterhelper.file import load_wl_time_report_aggregate
 from varats.paper_mgmt.case_study import get_case_study_file_name_filter
 from varats.paper_mgmt.paper_config import get_loaded_paper_config
 from varats.report.gnu_time_report import (
@@ -24,7 +25,7 @@ class TimedWorkloadTable(Table, table_name="time_workloads"):
     def tabulate(self, table_format: TableFormat, wrap_table: bool) -> str:
         case_studies = get_loaded_paper_config().get_all_case_studies()
 
-        df = pd.DataFrame()
+        rows: tp.List[tp.Dict[str, tp.Any]] = []
 
         for case_study in case_studies:
             project_name = case_study.project_name
@@ -53,13 +54,16 @@ class TimedWorkloadTable(Table, table_name="time_workloads"):
                 )
 
             for report_filepath in report_files:
-                agg_time_report = WLTimeReportAggregate(
+                agg_time_report = load_wl_time_report_aggregate(
                     report_filepath.full_path()
                 )
                 report_file = agg_time_report.filename
 
                 for workload_name in agg_time_report.workload_names():
-                    new_row = {
+                    wall_clock_times = wall_clock_time_in_msecs(
+                        agg_time_report
+                    )
+                    rows.append({
                         "Project":
                             project_name,
                         "Binary":
@@ -69,13 +73,9 @@ class TimedWorkloadTable(Table, table_name="time_workloads"):
                         "Workload":
                             workload_name,
                         "Mean wall time (msecs)":
-                            np.mean(wall_clock_time_in_msecs(agg_time_report)),
+                            np.mean(wall_clock_times),
                         "StdDev":
-                            round(
-                                np.std(
-                                    wall_clock_time_in_msecs(agg_time_report)
-                                ), 2
-                            ),
+                            round(np.std(wall_clock_times), 2),
                         "Max resident size (kbytes)":
                             max(
                                 agg_time_report.
@@ -83,10 +83,16 @@ class TimedWorkloadTable(Table, table_name="time_workloads"):
                             ),
                         "Reps":
                             len(agg_time_report.reports(workload_name))
-                    }
-
-                    df = df.append(new_row, ignore_index=True)
-
+                    })
+
+        df = pd.DataFrame(
+            rows,
+            columns=[
+                "Project", "Binary", "Revision", "Workload",
+                "Mean wall time (msecs)", "StdDev",
+                "Max resident size (kbytes)", "Reps"
+            ]
+        )
         df.sort_values(["Project", "Binary"], inplace=True)
         df.set_index(
             ["Project", "Binary"],
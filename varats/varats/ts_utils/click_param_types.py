@@ -5,6 +5,7 @@ from enum import Enum
 
 import click
 from benchbuild.experiment import ExperimentRegistry
+from click.shell_completion import CompletionItem
 
 from varats.data.discover_reports import initialize_reports
 from varats.experiments.discover_experiments import initialize_experiments
@@ -79,6 +80,47 @@ class TypedMultiChoice(click.Choice, tp.Generic[ChoiceTy]):
         ]
 
 
+class LazyChoice(click.ParamType, tp.Generic[ChoiceTy]):
+    """
+    Choice parameter type that creates its underlying choice type only when
+    it is first needed.
+
+    This allows to define options whose choices are expensive to compute,
+    e.g., because they require loading the paper config, without paying that
+    cost for every command that does not use them.
+    """
+
+    name = "lazy choice"
+
+    def __init__(self, create_choice: tp.Callable[[], click.Choice]) -> None:
+        self.__create_choice = create_choice
+        self.__choice: tp.Optional[click.Choice] = None
+
+    @property
+    def choice(self) -> click.Choice:
+        """The underlying choice type; created on first access."""
+        if self.__choice is None:
+            self.__choice = self.__create_choice()
+        return self.__choice
+
+    def get_metavar(self, param: click.Parameter) -> tp.Optional[str]:
+        return self.choice.get_metavar(param)
+
+    def get_missing_message(self, param: click.Parameter) -> str:
+        return self.choice.get_missing_message(param)
+
+    def convert(
+        self, value: tp.Any, param: tp.Optional[click.Parameter],
+        ctx: tp.Optional[click.Context]
+    ) -> ChoiceTy:
+        return tp.cast(ChoiceTy, self.choice.convert(value, param, ctx))
+
+    def shell_complete(
+        self, ctx: click.Context, param: click.Parameter, incomplete: str
+    ) -> tp.List[CompletionItem]:
+        return self.choice.shell_complete(ctx, param, incomplete)
+
+
 EnumTy = tp.TypeVar("EnumTy", bound=Enum)
 
 
@@ -192,7 +234,7 @@ REQUIRE_CASE_STUDY: CLIOptionTy = convert_value(
     make_cli_option(
         "-cs",
         "--case-study",
-        type=create_single_case_study_choice(),
+        type=LazyChoice(create_single_case_study_choice),
         required=True,
         metavar="NAME",
         help="The case study to use."
@@ -204,7 +246,7 @@ REQUIRE_MULTI_CASE_STUDY: CLIOptionTy = convert_value(
     make_cli_option(
         "-cs",
         "--case-study",
-        type=create_multi_case_study_choice(),
+        type=LazyChoice(create_multi_case_study_choice),
         required=True,
         metavar="NAMES",
         help="One or more case studies to use."